@@ -0,0 +1,65 @@
+"""Caching helpers for async functions."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from functools import wraps
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def async_ttl_cache(
+    ttl: float = 5.0, maxsize: int = 128
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """
+    Decorator caching an async function's results for a short time.
+
+    Results are keyed by the call's (hashable) arguments and reused for ``ttl``
+    seconds after the call completes. Concurrent callers with the same arguments
+    share a single in-flight call instead of each starting their own. Exceptions
+    are not cached. At most ``maxsize`` results are kept, least recently used
+    first out.
+
+    The wrapper exposes ``cache_clear()`` to drop all cached results.
+
+    Usage:
+      @async_ttl_cache(ttl=5.0)
+      async def get_namespaces(context: str | None) -> NamespacesResponse:
+          ...
+    """
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        # key -> (expiry, task); expiry is infinite while the call is in flight
+        cache: OrderedDict[Hashable, tuple[float, asyncio.Task[T]]] = OrderedDict()
+
+        def _on_done(key: Hashable, task: asyncio.Task[T]) -> None:
+            entry = cache.get(key)
+            if entry is None or entry[1] is not task:
+                return
+            if task.cancelled() or task.exception() is not None:
+                del cache[key]
+            else:
+                cache[key] = (time.monotonic() + ttl, task)
+
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            entry = cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                cache.move_to_end(key)
+                task = entry[1]
+            else:
+                task = asyncio.ensure_future(func(*args, **kwargs))
+                cache[key] = (float("inf"), task)
+                task.add_done_callback(lambda t: _on_done(key, t))
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+            # A cancelled caller must not cancel the call other callers are waiting on
+            return await asyncio.shield(task)
+
+        wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
@@ -1,6 +1,6 @@
 import asyncio
+import contextlib
 import json
-import subprocess
 from typing import Any
 
 from mcp.server.fastmcp import Context
@@ -8,17 +8,68 @@ from mcp.server.session import ServerSession
 
 from . import logger
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+
+def _json_loads(data: bytes | str) -> Any:
+    """Parse JSON with orjson when installed, else the stdlib parser.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either.
+    """
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class _CommandString:
+    """Space-joined command line, built only when a message actually formats it."""
+
+    __slots__ = ("_cmd", "_str")
+
+    def __init__(self, cmd: list[str]):
+        self._cmd = cmd
+        self._str: str | None = None
+
+    def __str__(self) -> str:
+        if self._str is None:
+            self._str = " ".join(self._cmd)
+        return self._str
+
 
 class CommandError(Exception):
     """Custom exception for command execution errors."""
 
-    def __init__(self, message: str, cmd: list[str], returncode: int, stderr: str = ""):
-        self.message = message
+    def __init__(
+        self,
+        message: str,
+        cmd: list[str],
+        returncode: int,
+        stderr: str = "",
+        *,
+        include_stderr: bool = False,
+    ):
+        self.base_message = message
         self.cmd = cmd
         self.returncode = returncode
         self.stderr = stderr
+        self.include_stderr = include_stderr
         super().__init__(message)
 
+    @property
+    def message(self) -> str:
+        """Error message, with the command's stderr appended if include_stderr is set."""
+        if self.include_stderr and self.stderr:
+            return f"{self.base_message}\nStderr: {self.stderr.strip()}"
+        return self.base_message
+
+    def __str__(self) -> str:
+        return self.message
+
 
 async def run_command(
     cmd: list[str],
@@ -49,69 +100,126 @@ async def run_command(
     Raises:
         CommandError: If command fails and check=True
     """
-    cmd_str = " ".join(cmd)
-    await logger.debug(f"Running command: {cmd_str}", component="cmd_runner", ctx=ctx)
+    cmd_str = _CommandString(cmd)
+    await logger.debug("Running command: %s", cmd_str, component="cmd_runner", ctx=ctx)
 
     try:
-        # Run command in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None,
-            lambda: subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                check=False,  # We'll handle check ourselves
-                cwd=cwd,
-                env=env,
-            ),
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+            env=env,
         )
+        try:
+            stdout, stderr_bytes = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        except BaseException:
+            # Timed out or cancelled - don't leave the child process running
+            with contextlib.suppress(ProcessLookupError):
+                proc.kill()
+            await proc.wait()
+            raise
 
-        # Handle non-zero exit codes
-        if result.returncode != 0 and check:
-            error_msg = f"Command failed with exit code {result.returncode}: {cmd_str}"
-            if result.stderr:
-                error_msg += f"\nStderr: {result.stderr.strip()}"
-
-            if log_errors:
-                await logger.error(error_msg, component="cmd_runner", ctx=ctx)
+        # communicate() has already reaped the process, so this returns at once
+        returncode = await proc.wait()
+        stderr = stderr_bytes.decode(errors="replace")
 
-            raise CommandError(
-                message=error_msg, cmd=cmd, returncode=result.returncode, stderr=result.stderr
+        # Handle non-zero exit codes
+        if returncode != 0 and check:
+            error = CommandError(
+                message=f"Command failed with exit code {returncode}: {cmd_str}",
+                cmd=cmd,
+                returncode=returncode,
+                stderr=stderr,
+                include_stderr=True,
             )
+            if log_errors:
+                await logger.error("%s", error, component="cmd_runner", ctx=ctx)
+            raise error
 
-        # Parse JSON if requested
-        if parse_json and result.stdout:
+        # Parse JSON if requested (straight from bytes, no intermediate str)
+        if parse_json and stdout:
             try:
-                return json.loads(result.stdout)
+                return _json_loads(stdout)
             except json.JSONDecodeError as e:
-                error_msg = f"Failed to parse command output as JSON: {str(e)}"
+                error = CommandError(
+                    message=f"Failed to parse command output as JSON: {str(e)}",
+                    cmd=cmd,
+                    returncode=returncode,
+                    stderr=str(e),
+                )
                 if log_errors:
                     await logger.error(
-                        f"{error_msg}\nCommand: {cmd_str}\nOutput: {result.stdout[:500]}...",
+                        "%s\nCommand: %s\nOutput: %s...",
+                        error,
+                        cmd_str,
+                        stdout[:500].decode(errors="replace"),
                         component="cmd_runner",
                         ctx=ctx,
                     )
-                raise CommandError(
-                    message=error_msg, cmd=cmd, returncode=result.returncode, stderr=str(e)
-                )
+                raise error from e
 
         await logger.debug(
-            f"Command completed successfully: {cmd_str}", component="cmd_runner", ctx=ctx
+            "Command completed successfully: %s", cmd_str, component="cmd_runner", ctx=ctx
         )
-        return result.stdout
+        return stdout.decode(errors="replace")
 
-    except subprocess.TimeoutExpired:
-        error_msg = f"Command timed out after {timeout}s: {cmd_str}"
+    except CommandError:
+        raise
+    except asyncio.TimeoutError as e:
+        error = CommandError(
+            message=f"Command timed out after {timeout}s: {cmd_str}",
+            cmd=cmd,
+            returncode=-1,
+            stderr="Command timed out",
+        )
         if log_errors:
-            await logger.error(error_msg, component="cmd_runner", ctx=ctx)
-        raise CommandError(message=error_msg, cmd=cmd, returncode=-1, stderr="Command timed out")
+            await logger.error("%s", error, component="cmd_runner", ctx=ctx)
+        raise error from e
     except Exception as e:
-        error_msg = f"Unexpected error running command: {cmd_str} - {str(e)}"
+        error = CommandError(
+            message=f"Unexpected error running command: {cmd_str} - {str(e)}",
+            cmd=cmd,
+            returncode=-1,
+            stderr=str(e),
+        )
         if log_errors:
-            await logger.error(error_msg, component="cmd_runner", ctx=ctx)
-        raise CommandError(message=error_msg, cmd=cmd, returncode=-1, stderr=str(e))
+            await logger.error("%s", error, component="cmd_runner", ctx=ctx)
+        raise error from e
+
+
+def _build_kubectl_cmd(
+    args: list[str], context: str | None, namespace: str | None, output_format: str | None
+) -> list[str]:
+    """Build a full kubectl command line from arguments and common options."""
+    # Only a leading "kubectl" is the executable; later ones are argument values.
+    # Always copy so the caller's list isn't extended in place.
+    cmd = list(args) if args and args[0] == "kubectl" else ["kubectl", *args]
+
+    # Add context if specified
+    if context:
+        cmd.extend(["--context", context])
+
+    # Add namespace if specified
+    if namespace:
+        cmd.extend(["--namespace", namespace])
+
+    # Add output format if not already specified (-o, -o=json, -ojson, --output[=json])
+    if output_format:
+        for arg in args:
+            if arg.startswith("-o") or arg == "--output" or arg.startswith("--output="):
+                break
+        else:
+            cmd.extend(["--output", output_format])
+
+    return cmd
+
+
+def _fields_output_format(fields: list[str]) -> str:
+    """Build a jsonpath output format printing one tab-separated line per list item."""
+    columns = '{"\\t"}'.join(f"{{{field}}}" for field in fields)
+    return f'jsonpath={{range .items[*]}}{columns}{{"\\n"}}{{end}}'
 
 
 async def run_kubectl_command(
@@ -120,6 +228,7 @@ async def run_kubectl_command(
     context: str | None = None,
     namespace: str | None = None,
     output_format: str = "json",
+    fields: list[str] | None = None,
     ctx: Context[ServerSession, Any] | None = None,
     **kwargs,
 ) -> str | dict[str, Any] | list[Any]:
@@ -131,38 +240,33 @@ async def run_kubectl_command(
         context: Kubernetes context to use
         namespace: Kubernetes namespace to use
         output_format: Output format (json, yaml, etc.)
+        fields: JSONPath fields to extract from each item of a list response,
+            e.g. [".metadata.name", ".status.phase"]. Overrides output_format so
+            kubectl only prints those fields instead of full objects.
         **kwargs: Additional arguments passed to run_command
 
     Returns:
-        Command output, parsed as JSON if output_format is 'json'
+        Command output, parsed as JSON if output_format is 'json', or one
+        {field: value} dict per item if fields is given
     """
-    if "kubectl" not in args:
-        cmd = ["kubectl"] + args
-    else:
-        cmd = args
-
-    # Add context if specified
-    if context:
-        cmd.extend(["--context", context])
-
-    # Add namespace if specified
-    if namespace:
-        cmd.extend(["--namespace", namespace])
-
-    # Add output format if not already specified
-    has_output_flag = any(arg.startswith(("-o", "--output")) for arg in args)
-    if output_format and not has_output_flag:
-        cmd.extend(["--output", output_format])
+    if fields:
+        output_format = _fields_output_format(fields)
+    cmd = _build_kubectl_cmd(args, context, namespace, output_format)
 
     # Parse JSON by default if output format is json
     parse_json = kwargs.pop("parse_json", output_format == "json")
 
     try:
-        return await run_command(cmd, parse_json=parse_json, ctx=ctx, **kwargs)
+        output = await run_command(cmd, parse_json=parse_json, ctx=ctx, **kwargs)
+        if fields and isinstance(output, str):
+            return [
+                dict(zip(fields, line.split("\t"), strict=False)) for line in output.splitlines()
+            ]
+        return output
     except CommandError as e:
         if "unknown flag: --output" in e.stderr or "unknown flag: --output" in e.message:
             await logger.debug(
-                f"Command doesn't support --output flag, retrying without it",
+                "Command doesn't support --output flag, retrying without it",
                 component="cmd_runner",
                 ctx=ctx,
             )
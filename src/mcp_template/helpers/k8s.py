@@ -1,6 +1,10 @@
+import asyncio
+import contextlib
 import os
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Generic, TypeGuard, TypeVar, cast
 
 import yaml
 from mcp.server.fastmcp import Context
@@ -13,41 +17,123 @@ from ..models import (
     KubernetesNamespace,
     NamespacesResponse,
 )
-from .cmd_runner import run_command, run_kubectl_command
+from .cmd_runner import CommandError, run_command, run_kubectl_command
+
+try:
+    # libyaml-backed loader, much faster than the pure-Python one
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment, unused-ignore]
+
+_NAMESPACE_FIELDS = [".metadata.name", ".metadata.creationTimestamp", ".status.phase"]
+
+# How long kubeconfig-derived results are reused (they are dropped early if the file changes)
+_CACHE_TTL = 30.0
+
+
+T = TypeVar("T")
+
+# (path, mtime_ns, size) of the kubeconfig file, or None if it is missing
+_Stamp = tuple[str, int, int] | None
+
+
+@dataclass(frozen=True)
+class _CacheEntry(Generic[T]):
+    created: float
+    stamp: _Stamp
+    value: T
+
+
+_default_context_cache: _CacheEntry[str | None] | None = None
+_default_context_lock = asyncio.Lock()
+_kubeconfig_cache: _CacheEntry[dict[str, Any]] | None = None
+
+
+def _kubeconfig_path() -> str:
+    """Get kubeconfig path from environment or default location."""
+    return os.environ.get("KUBECONFIG", str(Path.home() / ".kube" / "config"))
+
+
+def _kubeconfig_stamp(path: str) -> _Stamp:
+    """Identify the current version of the kubeconfig file, or None if it is missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+
+def _cached(entry: _CacheEntry[T] | None, stamp: _Stamp) -> TypeGuard[_CacheEntry[T]]:
+    """Check whether a cache entry is fresh and the kubeconfig hasn't changed since."""
+    return (
+        entry is not None and entry.stamp == stamp and time.monotonic() - entry.created < _CACHE_TTL
+    )
+
+
+def _load_kubeconfig(path: str) -> dict[str, Any]:
+    """Parse the kubeconfig file, reusing the previous result while it is unchanged."""
+    global _kubeconfig_cache
+
+    stamp = _kubeconfig_stamp(path)
+    if _cached(_kubeconfig_cache, stamp):
+        return _kubeconfig_cache.value
+
+    with open(path) as f:
+        kubeconfig: dict[str, Any] = yaml.load(f, Loader=SafeLoader)
+
+    _kubeconfig_cache = _CacheEntry(time.monotonic(), stamp, kubeconfig)
+    return kubeconfig
 
 
 async def get_default_context(ctx: Context[ServerSession, Any] | None = None) -> str | None:
     """Get the current default kubectl context.
 
-    First tries to get it via kubectl command, then falls back to reading kubeconfig file.
+    The result is cached for a short time and refreshed as soon as the kubeconfig
+    file changes, so most tool calls don't need to spawn kubectl.
 
     Returns:
         The current context name, or None if unable to determine
     """
+    global _default_context_cache
 
-    # First try using kubectl command
-    result = await run_command(
-        ["kubectl", "config", "current-context"], ctx=ctx, log_errors=False, check=False
-    )
+    stamp = _kubeconfig_stamp(_kubeconfig_path())
+    if _cached(_default_context_cache, stamp):
+        return _default_context_cache.value
+
+    # Concurrent callers wait for a single kubectl lookup instead of each running one
+    async with _default_context_lock:
+        if _cached(_default_context_cache, stamp):
+            return _default_context_cache.value
+
+        current_context = None
+        result = await run_command(
+            ["kubectl", "config", "current-context"], ctx=ctx, log_errors=False, check=False
+        )
+        if result and isinstance(result, str):
+            current_context = result.strip() or None
 
-    if result and isinstance(result, str):
-        current_context = result.strip()
-        if current_context:
-            return current_context
+        _default_context_cache = _CacheEntry(time.monotonic(), stamp, current_context)
+        return current_context
 
-    return None
+
+async def prewarm() -> None:
+    """Fill the kubeconfig and default context caches ahead of requests.
+
+    Failures are ignored: the first request that needs the data then does the work,
+    and reports any error, itself.
+    """
+    with contextlib.suppress(OSError, yaml.YAMLError):
+        _load_kubeconfig(_kubeconfig_path())
+    with contextlib.suppress(CommandError):
+        await get_default_context()
 
 
 async def get_kubectl_contexts(
     ctx: Context[ServerSession, Any] | None = None,
 ) -> KubectlContextsResponse:
     """Get list of available kubectl contexts by reading the kubeconfig file."""
-    # Get kubeconfig path from environment or default location
-    kubeconfig_path = os.environ.get("KUBECONFIG", str(Path.home() / ".kube" / "config"))
-
     try:
-        with open(kubeconfig_path) as f:
-            kubeconfig = yaml.safe_load(f)
+        kubeconfig = _load_kubeconfig(_kubeconfig_path())
 
         contexts = []
         current_context = kubeconfig.get("current-context", "")
@@ -57,38 +143,34 @@ async def get_kubectl_contexts(
             context_data = context_config.get("context", {})
 
             contexts.append(
-                KubectlContext(
-                    name=context_name,
-                    cluster=context_data.get("cluster", ""),
-                    user=context_data.get("user", ""),
-                    namespace=context_data.get("namespace", ""),
+                KubectlContext.from_trusted(
+                    name=str(context_name),
+                    cluster=str(context_data.get("cluster", "")),
+                    user=str(context_data.get("user", "")),
+                    namespace=str(context_data.get("namespace", "")),
                     current=context_name == current_context,
                 )
             )
 
-        return KubectlContextsResponse(contexts=contexts, total_count=len(contexts))
+        return KubectlContextsResponse.from_trusted(contexts)
 
     except FileNotFoundError:
-        return KubectlContextsResponse(contexts=[], total_count=0)
+        return KubectlContextsResponse.from_trusted([])
     except yaml.YAMLError:
-        return KubectlContextsResponse(contexts=[], total_count=0)
+        return KubectlContextsResponse.from_trusted([])
 
 
 async def get_cluster_info(
     context: str | None = None, ctx: Context[ServerSession, Any] | None = None
 ) -> ClusterInfo:
     """Get cluster information for specified context or default."""
-    # Get cluster info
-    cluster_info = await run_kubectl_command(
-        ["cluster-info"], context=context, ctx=ctx, output_format=None
+    # Cluster info and version are independent, so fetch them concurrently
+    cluster_info, version_info = await asyncio.gather(
+        run_kubectl_command(["cluster-info"], context=context, ctx=ctx, output_format=None),
+        run_kubectl_command(["version"], context=context, ctx=ctx, output_format=None),
     )
 
-    # Get version info
-    version_info = await run_kubectl_command(
-        ["version"], context=context, ctx=ctx, output_format=None
-    )
-
-    return ClusterInfo(
+    return ClusterInfo.from_trusted(
         cluster_info=cluster_info,
         version_info=version_info,
         context=context,
@@ -99,9 +181,23 @@ async def get_namespaces(
     context: str | None = None, ctx: Context[ServerSession, Any] | None = None
 ) -> NamespacesResponse:
     """Get list of namespaces in the cluster."""
-    namespaces_data = await run_kubectl_command(["get", "namespaces"], context=context, ctx=ctx)
-    namespace_items = namespaces_data.get("items", [])
-
-    namespaces = [KubernetesNamespace(**item) for item in namespace_items]
+    # Only fetch the fields the models expose instead of full namespace objects
+    rows = cast(
+        list[dict[str, str]],
+        await run_kubectl_command(
+            ["get", "namespaces"], context=context, ctx=ctx, fields=_NAMESPACE_FIELDS
+        ),
+    )
 
-    return NamespacesResponse(namespaces=namespaces, total_count=len(namespaces), context=context)
+    namespaces = [
+        KubernetesNamespace.from_trusted(
+            metadata={
+                "name": row[".metadata.name"],
+                "creationTimestamp": row.get(".metadata.creationTimestamp") or None,
+            },
+            status={"phase": row.get(".status.phase") or None},
+        )
+        for row in rows
+    ]
+
+    return NamespacesResponse.from_trusted(namespaces, context=context)
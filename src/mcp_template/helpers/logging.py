@@ -1,6 +1,6 @@
 """Singleton MCP context logging utilities."""
 
-from typing import Any, Optional
+from typing import Any, Literal, Optional
 
 from mcp.server.fastmcp import Context
 from mcp.server.session import ServerSession
@@ -22,86 +22,78 @@ class Logger:
         if ctx and self._ctx is None:
             self._ctx = ctx
 
-    def _ensure_initialized(self) -> None:
-        """Ensure logger is initialized, raise error if not."""
-        if self._ctx is None:
-            raise RuntimeError("Logger not initialized. No context available.")
+    def _is_initialized(self, ctx: Context[ServerSession, Any] | None) -> bool:
+        """Check whether a context is available, initializing from ctx if needed."""
+        self._auto_initialize(ctx)
+        return self._ctx is not None
+
+    async def _log(
+        self,
+        level: Literal["debug", "info", "warning", "error"],
+        message: str,
+        args: tuple[Any, ...],
+        component: str,
+        extra: dict[str, Any] | None,
+        ctx: Context[ServerSession, Any] | None,
+    ) -> None:
+        """Format and send a message, skipping all work when there is no context."""
+        if not self._is_initialized(ctx):
+            # No context available (tests, CLI) - nothing to send to
+            return
+        if args:
+            message = message % args
+        formatted_message = f"[{component}] {message}"
+        if extra:
+            formatted_message += f" | {extra}"
+        try:
+            await self._ctx.log(level, formatted_message)
+        except ValueError:
+            # Context used outside of a request - ignore
+            pass
 
     async def debug(
         self,
         message: str,
+        *args: Any,
         component: str = "server",
         extra: dict[str, Any] | None = None,
         ctx: Context[ServerSession, Any] | None = None,
     ) -> None:
-        """Send debug message to client."""
-        try:
-            self._auto_initialize(ctx)
-            self._ensure_initialized()
-            formatted_message = f"[{component}] {message}"
-            if extra:
-                formatted_message += f" | {extra}"
-            await self._ctx.debug(formatted_message)
-        except (RuntimeError, ValueError):
-            # Logger not initialized or context not available (tests) - ignore
-            pass
+        """Send debug message to client, %-formatting message with args only if sent."""
+        await self._log("debug", message, args, component, extra, ctx)
 
     async def info(
         self,
         message: str,
+        *args: Any,
         component: str = "server",
         extra: dict[str, Any] | None = None,
         ctx: Context[ServerSession, Any] | None = None,
     ) -> None:
-        """Send info message to client."""
-        try:
-            self._auto_initialize(ctx)
-            self._ensure_initialized()
-            formatted_message = f"[{component}] {message}"
-            if extra:
-                formatted_message += f" | {extra}"
-            await self._ctx.info(formatted_message)
-        except (RuntimeError, ValueError):
-            # Logger not initialized or context not available (tests) - ignore
-            pass
+        """Send info message to client, %-formatting message with args only if sent."""
+        await self._log("info", message, args, component, extra, ctx)
 
     async def warning(
         self,
         message: str,
+        *args: Any,
         component: str = "server",
         extra: dict[str, Any] | None = None,
         ctx: Context[ServerSession, Any] | None = None,
     ) -> None:
-        """Send warning message to client."""
-        try:
-            self._auto_initialize(ctx)
-            self._ensure_initialized()
-            formatted_message = f"[{component}] {message}"
-            if extra:
-                formatted_message += f" | {extra}"
-            await self._ctx.warning(formatted_message)
-        except (RuntimeError, ValueError):
-            # Logger not initialized or context not available (tests) - ignore
-            pass
+        """Send warning message to client, %-formatting message with args only if sent."""
+        await self._log("warning", message, args, component, extra, ctx)
 
     async def error(
         self,
         message: str,
+        *args: Any,
         component: str = "server",
         extra: dict[str, Any] | None = None,
         ctx: Context[ServerSession, Any] | None = None,
     ) -> None:
-        """Send error message to client."""
-        try:
-            self._auto_initialize(ctx)
-            self._ensure_initialized()
-            formatted_message = f"[{component}] {message}"
-            if extra:
-                formatted_message += f" | {extra}"
-            await self._ctx.error(formatted_message)
-        except (RuntimeError, ValueError):
-            # Logger not initialized or context not available (tests) - ignore
-            pass
+        """Send error message to client, %-formatting message with args only if sent."""
+        await self._log("error", message, args, component, extra, ctx)
 
 
 # Global singleton instance
@@ -3,8 +3,11 @@
 import asyncio
 import inspect
 import re
+import reprlib
 from collections.abc import Callable, Iterable
-from functools import wraps
+from collections.abc import Set as AbstractSet
+from functools import lru_cache, wraps
+from itertools import islice
 from typing import Any
 
 from opentelemetry import trace
@@ -16,36 +19,121 @@ TracerLike = trace.Tracer
 SECRET_VALUE_RE = re.compile(
     r"(?:^|[^a-zA-Z])(token|secret|password|apikey|api_key|bearer)[^a-zA-Z]?", re.I
 )
+# Keywords SECRET_VALUE_RE looks for; an ASCII value containing none of them can't match
+_SECRET_VALUE_WORDS = ("token", "secret", "password", "apikey", "api_key", "bearer")
+# Shortest keyword SECRET_VALUE_RE can match; shorter strings are never scanned
+_SECRET_VALUE_MIN_LEN = min(len(word) for word in _SECRET_VALUE_WORDS)
+
+_SECRET_KEY_WORDS = ("token", "secret", "password", "passwd", "apikey", "api_key", "bearer")
+
+_CTX_ATTRIBUTES = ("request_id", "session_id", "client", "protocol_version")
+
+# Maps a call's (args, kwargs) to {parameter name: value}
+_ArgBinder = Callable[[tuple[Any, ...], dict[str, Any]], dict[str, Any]]
+
+
+class _BoundedRepr(reprlib.Repr):
+    """reprlib.Repr that keeps dicts in insertion order, like the builtin repr."""
+
+    def repr_dict(self, x: dict[Any, Any], level: int) -> str:
+        if not x:
+            return "{}"
+        if level <= 0:
+            return "{...}"
+        pieces = [
+            f"{self.repr1(k, level - 1)}: {self.repr1(v, level - 1)}"
+            for k, v in islice(x.items(), self.maxdict)
+        ]
+        if len(x) > self.maxdict:
+            pieces.append("...")
+        return "{" + ", ".join(pieces) + "}"
+
+
+@lru_cache(maxsize=8)
+def _bounded_repr(max_len: int) -> reprlib.Repr:
+    """A repr whose output (and work) is bounded, but exact for anything under max_len."""
+    r = _BoundedRepr()
+    # Each element or nesting level adds at least 2 characters, so nothing that would
+    # fit in max_len gets elided
+    limit = max(max_len // 2, 1)
+    r.maxlevel = r.maxtuple = r.maxlist = r.maxarray = r.maxdict = limit
+    r.maxset = r.maxfrozenset = r.maxdeque = limit
+    r.maxstring = r.maxlong = r.maxother = max_len
+    return r
 
 
 def _truncate(value: Any, max_len: int = 256) -> str:
-    try:
-        s = str(value)
-    except Exception:
-        s = repr(value)
+    if type(value) is str:
+        s = value
+    elif isinstance(value, (list, tuple, dict, set, frozenset)):
+        # Don't stringify a whole (possibly huge) container just to cut it down
+        try:
+            s = _bounded_repr(max_len).repr(value)
+        except Exception:
+            s = object.__repr__(value)
+    else:
+        try:
+            s = str(value)
+        except Exception:
+            s = repr(value)
     if len(s) > max_len:
         return s[: max_len - 1] + "…"
     return s
 
 
-def _should_redact(key: str, value: Any, redact_keys: Iterable[str]) -> bool:
-    if key.lower() in {k.lower() for k in redact_keys}:
-        return True
-    if any(
-        x in key.lower()
-        for x in ["token", "secret", "password", "passwd", "apikey", "api_key", "bearer"]
-    ):
-        return True
-    if isinstance(value, str) and SECRET_VALUE_RE.search(value or ""):
+def _is_secret_key(key: str, redact_keys: AbstractSet[str]) -> bool:
+    kl = key.lower()
+    return kl in redact_keys or any(word in kl for word in _SECRET_KEY_WORDS)
+
+
+def _is_secret_value(value: Any) -> bool:
+    if not isinstance(value, str) or len(value) < _SECRET_VALUE_MIN_LEN:
+        return False
+    # Plain substring checks reject most values far faster than the regex can. They only
+    # agree with it on ASCII text: under re.I the regex also matches non-ASCII letters
+    # such as "ſ" (s), "ı" (i) and the Kelvin sign (k), so other text goes straight to it.
+    if value.isascii():
+        lowered = value.lower()
+        if not any(word in lowered for word in _SECRET_VALUE_WORDS):
+            return False
+    return SECRET_VALUE_RE.search(value) is not None
+
+
+def _tracing_enabled(tracer_: TracerLike, explicit: bool) -> bool:
+    if isinstance(tracer_, trace.NoOpTracer):
+        return False
+    if explicit:
         return True
-    return False
+    # Without a configured provider the global tracer only hands out non-recording spans
+    return not isinstance(
+        trace.get_tracer_provider(), (trace.NoOpTracerProvider, trace.ProxyTracerProvider)
+    )
+
+
+def _make_arg_binder(sig: inspect.Signature) -> _ArgBinder:
+    """Return a cheap per-call argument binder for a pre-resolved signature."""
+    params = list(sig.parameters.values())
+
+    if any(p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD) for p in params):
+
+        def bind_generic(args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+            bound = sig.bind_partial(*args, **kwargs)
+            bound.apply_defaults()
+            return dict(bound.arguments)
+
+        return bind_generic
 
+    # Plain named parameters: build the mapping directly, skipping BoundArguments
+    names = tuple(p.name for p in params)
+    defaults = {p.name: p.default for p in params if p.default is not p.empty}
 
-def _bind_args(func: Callable, args: tuple, kwargs: dict) -> dict[str, Any]:
-    sig = inspect.signature(func)
-    bound = sig.bind_partial(*args, **kwargs)
-    bound.apply_defaults()
-    return dict(bound.arguments)
+    def bind_named(args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+        bound = dict(defaults)
+        bound.update(zip(names, args, strict=False))
+        bound.update(kwargs)
+        return bound
+
+    return bind_named
 
 
 def tracer(
@@ -74,6 +162,9 @@ def tracer(
       kind: SpanKind, default INTERNAL
       tracer_provider: optional custom tracer (else global)
 
+    If tracing is disabled when the decorator is applied (no tracer provider has been
+    configured, or the tracer is a no-op), the function is returned unwrapped.
+
     Usage:
       @mcp.tool()
       @tracer()
@@ -81,47 +172,62 @@ def tracer(
           ...
     """
     _tracer = tracer_provider or trace.get_tracer("mcp.fastmcp.tools")
+    _enabled = _tracing_enabled(_tracer, explicit=tracer_provider is not None)
 
     def decorator(func: Callable) -> Callable:
+        if not _enabled:
+            return func
+
         span_name = name or f"tool.{func.__name__}"
         allow = {x.lower() for x in arg_allowlist} if arg_allowlist else None
         deny = {x.lower() for x in arg_denylist} if arg_denylist else set()
         redact = set(x.lower() for x in redact_keys)
+        sig = inspect.signature(func)
+        bind_args = _make_arg_binder(sig)
+
+        # Attribute keys and key-based redaction only depend on parameter names,
+        # so decide them once here rather than on every call
+        name_attr = f"{attribute_prefix}.name"
+        return_len_attr = f"{attribute_prefix}.return_length"
+        arg_attr_prefix = f"{attribute_prefix}.arg."
+        recorded_args: dict[str, tuple[str, bool]] = {}
+        for k in sig.parameters:
+            kl = k.lower()
+            if k.startswith("_"):
+                continue
+            if allow is not None and kl not in allow:
+                continue
+            if kl in deny:
+                continue
+            recorded_args[k] = (arg_attr_prefix + k, _is_secret_key(kl, redact))
+        ctx_attrs = tuple((key, f"{attribute_prefix}.ctx.{key}") for key in _CTX_ATTRIBUTES)
 
         def _add_arg_attributes(span, bound_args: dict[str, Any]):
-            for k, v in bound_args.items():
-                kl = k.lower()
-                if k.startswith("_"):
-                    continue
-                if allow is not None and kl not in allow:
-                    continue
-                if kl in deny:
+            for k, (attr_key, redact_by_key) in recorded_args.items():
+                if k not in bound_args:
                     continue
-                if _should_redact(kl, v, redact):
-                    span.set_attribute(f"{attribute_prefix}.arg.{k}", "***")
+                v = bound_args[k]
+                if redact_by_key or _is_secret_value(v):
+                    span.set_attribute(attr_key, "***")
                 else:
-                    span.set_attribute(
-                        f"{attribute_prefix}.arg.{k}", _truncate(v, max_len=max_value_len)
-                    )
+                    span.set_attribute(attr_key, _truncate(v, max_len=max_value_len))
 
         def _enrich_with_ctx(span, bound_args: dict[str, Any]):
             ctx = bound_args.get("ctx") or bound_args.get("context")
             if ctx is None:
                 return
-            for key in ("request_id", "session_id", "client", "protocol_version"):
+            for key, attr_key in ctx_attrs:
                 val = getattr(ctx, key, None)
                 if val:
-                    span.set_attribute(
-                        f"{attribute_prefix}.ctx.{key}", _truncate(val, max_value_len)
-                    )
+                    span.set_attribute(attr_key, _truncate(val, max_value_len))
 
         if asyncio.iscoroutinefunction(func):
 
             @wraps(func)
             async def awrapper(*args, **kwargs):
                 with _tracer.start_as_current_span(span_name, kind=kind) as span:
-                    span.set_attribute(f"{attribute_prefix}.name", func.__name__)
-                    bound = _bind_args(func, args, kwargs)
+                    span.set_attribute(name_attr, func.__name__)
+                    bound = bind_args(args, kwargs)
                     _add_arg_attributes(span, bound)
                     _enrich_with_ctx(span, bound)
                     try:
@@ -129,8 +235,7 @@ def tracer(
                         result = await func(*args, **kwargs)
                         if capture_return_len:
                             span.set_attribute(
-                                f"{attribute_prefix}.return_length",
-                                len(str(result)) if result is not None else 0,
+                                return_len_attr, len(str(result)) if result is not None else 0
                             )
                         span.add_event("finish", {"status": "ok"})
                         return result
@@ -146,8 +251,8 @@ def tracer(
             @wraps(func)
             def swrapper(*args, **kwargs):
                 with _tracer.start_as_current_span(span_name, kind=kind) as span:
-                    span.set_attribute(f"{attribute_prefix}.name", func.__name__)
-                    bound = _bind_args(func, args, kwargs)
+                    span.set_attribute(name_attr, func.__name__)
+                    bound = bind_args(args, kwargs)
                     _add_arg_attributes(span, bound)
                     _enrich_with_ctx(span, bound)
                     try:
@@ -155,8 +260,7 @@ def tracer(
                         result = func(*args, **kwargs)
                         if capture_return_len:
                             span.set_attribute(
-                                f"{attribute_prefix}.return_length",
-                                len(str(result)) if result is not None else 0,
+                                return_len_attr, len(str(result)) if result is not None else 0
                             )
                         span.add_event("finish", {"status": "ok"})
                         return result
@@ -2,11 +2,53 @@
 """Main entry point for the MCP server."""
 
 import sys
+from typing import TYPE_CHECKING
 
 import click
 
 from .server import create_server
 
+if TYPE_CHECKING:
+    from starlette.applications import Starlette
+
+
+def create_stateless_http_app() -> "Starlette":
+    """Create a streamable HTTP app that keeps no per-session state.
+
+    Used as the uvicorn app factory when running several worker processes: MCP
+    sessions live in process memory, so requests must not depend on which worker
+    served the previous one.
+    """
+    server = create_server()
+    server.settings.stateless_http = True
+    return server.streamable_http_app()
+
+
+def _serve(app: "Starlette | str", host: str, port: int, workers: int = 1) -> None:
+    """Serve an ASGI app (or an app factory import string) with uvicorn.
+
+    uvicorn's "auto" loop and HTTP implementations use uvloop and httptools when
+    they are installed (see the ``speedups`` extra), falling back to asyncio and h11.
+    Per-request access logging and the Server/Date headers are turned off to keep
+    the per-request overhead down.
+    """
+    # Imported here so the default stdio transport never loads uvicorn
+    import uvicorn
+
+    uvicorn.run(
+        app,
+        factory=isinstance(app, str),
+        workers=workers,
+        host=host,
+        port=port,
+        loop="auto",
+        http="auto",
+        log_level="warning",
+        access_log=False,
+        server_header=False,
+        date_header=False,
+    )
+
 
 @click.command()
 @click.option(
@@ -32,31 +74,45 @@ from .server import create_server
     default=False,
     help="Enable auto-reload for development (HTTP/SSE transport only)",
 )
-def main(transport: str, host: str, port: int, reload: bool) -> None:
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of worker processes for HTTP transport; more than 1 runs stateless (default: 1)",
+)
+def main(transport: str, host: str, port: int, reload: bool, workers: int) -> None:
     """Run the MCP server with the specified transport."""
-    # Create the server
-    server = create_server()
+    if workers > 1 and transport != "http":
+        raise click.BadParameter(
+            "multiple workers require --transport http", param_hint="--workers"
+        )
 
     try:
         if transport == "stdio":
             if reload:
                 click.echo("⚠️  Auto-reload is not supported with stdio transport", err=True)
             click.echo("🚀 Starting MCP server with stdio transport...", err=True)
-            server.run()
+            create_server().run()
         elif transport == "sse":
             reload_msg = " (auto-reload enabled)" if reload else ""
             click.echo(
                 f"🚀 Starting MCP server with SSE transport on {host}:{port}{reload_msg}...",
                 err=True,
             )
-            server.run(transport="sse", mount_path="/")
+            _serve(create_server().sse_app(mount_path="/"), host, port)
         elif transport == "http":
             reload_msg = " (auto-reload enabled)" if reload else ""
+            workers_msg = f" with {workers} stateless workers" if workers > 1 else ""
             click.echo(
-                f"🚀 Starting MCP server with HTTP transport on {host}:{port}{reload_msg}...",
+                f"🚀 Starting MCP server with HTTP transport on {host}:{port}"
+                f"{workers_msg}{reload_msg}...",
                 err=True,
             )
-            server.run(transport="streamable-http")
+            if workers > 1:
+                # Each worker process builds its own server from the factory
+                _serve(f"{__name__}:create_stateless_http_app", host, port, workers=workers)
+            else:
+                _serve(create_server().streamable_http_app(), host, port)
     except KeyboardInterrupt:
         click.echo("\n👋 Server stopped by user", err=True)
         sys.exit(0)
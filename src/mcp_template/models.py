@@ -2,14 +2,23 @@
 Pydantic models for MCP server responses.
 
 This module defines structured response models for better schema capabilities.
+
+Helpers build responses from data they have already parsed and typed, so they use
+the ``from_trusted`` constructors, which skip pydantic validation.
 """
 
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class _ResponseModel(BaseModel):
+    """Base for response models: immutable, since instances are shared between requests."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
-class KubectlContext(BaseModel):
+
+class KubectlContext(_ResponseModel):
     """Model for a kubectl context."""
 
     name: str = Field(description="Name of the context")
@@ -18,28 +27,60 @@ class KubectlContext(BaseModel):
     namespace: str = Field(default="", description="Default namespace")
     current: bool = Field(description="Whether this is the current context")
 
+    @classmethod
+    def from_trusted(
+        cls, name: str, cluster: str, user: str, namespace: str, current: bool
+    ) -> "KubectlContext":
+        """Build from already-typed values without validation."""
+        return cls.model_construct(
+            name=name, cluster=cluster, user=user, namespace=namespace, current=current
+        )
+
 
-class KubectlContextsResponse(BaseModel):
+class KubectlContextsResponse(_ResponseModel):
     """Response model for kubectl contexts."""
 
     contexts: list[KubectlContext] = Field(description="List of available contexts")
     total_count: int = Field(description="Total number of contexts")
 
+    @classmethod
+    def from_trusted(cls, contexts: list[KubectlContext]) -> "KubectlContextsResponse":
+        """Build from already-typed contexts without validation."""
+        return cls.model_construct(contexts=contexts, total_count=len(contexts))
 
-class ClusterInfo(BaseModel):
+
+class ClusterInfo(_ResponseModel):
     """Model for cluster information."""
 
     cluster_info: str = Field(description="Raw cluster info output")
     version_info: str = Field(description="Raw version info output")
-    context: str = Field(description="Context name used")
+    context: str | None = Field(
+        default=None, description="Context name used (None for the current context)"
+    )
+
+    @classmethod
+    def from_trusted(
+        cls, cluster_info: str, version_info: str, context: str | None
+    ) -> "ClusterInfo":
+        """Build from kubectl's text output without validation."""
+        return cls.model_construct(
+            cluster_info=cluster_info, version_info=version_info, context=context
+        )
 
 
-class KubernetesNamespace(BaseModel):
+class KubernetesNamespace(_ResponseModel):
     """Model for a Kubernetes namespace."""
 
     metadata: dict[str, Any] = Field(description="Namespace metadata")
     status: dict[str, Any] | None = Field(default=None, description="Namespace status")
 
+    @classmethod
+    def from_trusted(
+        cls, metadata: dict[str, Any], status: dict[str, Any] | None
+    ) -> "KubernetesNamespace":
+        """Build from already-extracted metadata and status without validation."""
+        return cls.model_construct(metadata=metadata, status=status)
+
     @property
     def name(self) -> str:
         """Get the namespace name."""
@@ -58,17 +99,48 @@ class KubernetesNamespace(BaseModel):
         return None
 
 
-class NamespacesResponse(BaseModel):
+class NamespacesResponse(_ResponseModel):
     """Response model for namespaces."""
 
     namespaces: list[KubernetesNamespace] = Field(description="List of namespaces")
     total_count: int = Field(description="Total number of namespaces")
-    context: str = Field(description="Context used to fetch namespaces")
+    context: str | None = Field(
+        default=None, description="Context used to fetch namespaces (None for the current context)"
+    )
 
+    @classmethod
+    def from_trusted(
+        cls, namespaces: list[KubernetesNamespace], context: str | None
+    ) -> "NamespacesResponse":
+        """Build from already-typed namespaces without validation."""
+        return cls.model_construct(
+            namespaces=namespaces, total_count=len(namespaces), context=context
+        )
 
-class ErrorResponse(BaseModel):
+
+class ErrorResponse(_ResponseModel):
     """Model for error responses."""
 
     error: str = Field(description="Error message")
     context: str | None = Field(default=None, description="Context where error occurred")
     details: dict[str, Any] | None = Field(default=None, description="Additional error details")
+
+    @classmethod
+    def from_trusted(
+        cls,
+        error: str,
+        context: str | None = None,
+        details: dict[str, Any] | None = None,
+    ) -> "ErrorResponse":
+        """Build from an error message without validation."""
+        return cls.model_construct(error=error, context=context, details=details)
+
+    @classmethod
+    def for_context(
+        cls, operation: str, context: str | None, exc: BaseException
+    ) -> "ErrorResponse":
+        """Build the error for a failed lookup of operation (e.g. "namespaces") in a context."""
+        location = f" for context '{context}'" if context is not None else ""
+        return cls.model_construct(
+            error=f"Error getting {operation}{location}: {exc}", context=context, details=None
+        )
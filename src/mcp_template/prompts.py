@@ -4,38 +4,68 @@ Prompts implementation for MCP server.
 This is where you define your prompts. Users mainly need to modify this file.
 """
 
+from functools import lru_cache
+from typing import Final
+
 from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.prompts import Prompt
+
+# Prompt text lives in module-level templates so it isn't rebuilt on every call, and
+# rendered prompts are cached per argument combination.
+
+_DIAGNOSTIC_AREAS: Final[dict[str, str]] = {
+    "general": "overall cluster health including nodes, pods, and system components",
+    "pods": "pod status, restarts, resource usage, and container issues",
+    "services": "service endpoints, load balancers, and networking configuration",
+    "networking": "network policies, DNS resolution, and connectivity issues",
+    "storage": "persistent volumes, storage classes, and mount issues",
+    "performance": "resource utilization, bottlenecks, and scaling issues",
+}
+
+_SCOPE_INSTRUCTIONS: Final[dict[str, str]] = {
+    "cluster": "Create a high-level cluster architecture showing nodes, namespaces, and major components",
+    "namespace": "Detail the architecture within namespace '{namespace}' showing all workloads and their relationships",
+    "application": "Focus on application-level architecture within '{namespace}' showing microservices and data flow",
+    "networking": "Emphasize network topology, ingress, services, and communication patterns",
+}
+
+_DASHBOARD_SECTION: Final = """
+6. **Visual Dashboard** (create a comprehensive monitoring dashboard):
+   - Generate a Mermaid diagram showing cluster architecture
+   - Create charts showing resource utilization trends
+   - Include status indicators for all major components
+   - Add capacity planning recommendations
+"""
 
+_METRICS_SECTION: Final = """
+4. **Resource Metrics & Utilization**:
+   - CPU and memory usage across nodes and pods
+   - Storage utilization and available capacity
+   - Network traffic patterns and bottlenecks
+   - Identify over/under-provisioned resources
 
-def register_prompts(mcp: FastMCP) -> None:
-    """Register all prompts with the FastMCP server."""
+5. **Capacity Planning**:
+   - Current vs. requested vs. allocated resources
+   - Scaling recommendations for deployments
+   - Node capacity analysis and expansion needs
+"""
 
-    @mcp.prompt()
-    def diagnose_cluster_issues(
-        context: str | None = None, namespace: str | None = None, focus_area: str = "general"
-    ) -> str:
-        """Generate a comprehensive diagnostic prompt for Kubernetes cluster issues.
-
-        Args:
-            context: Kubernetes context to diagnose (optional, uses current if not specified)
-            namespace: Specific namespace to focus on (optional, checks all if not specified)
-            focus_area: Area to focus diagnostics on - general, pods, services, networking, storage, or performance
-        """
-        context_info = f" in context '{context}'" if context else ""
-        namespace_info = f" in namespace '{namespace}'" if namespace else " across all namespaces"
-
-        diagnostic_areas = {
-            "general": "overall cluster health including nodes, pods, and system components",
-            "pods": "pod status, restarts, resource usage, and container issues",
-            "services": "service endpoints, load balancers, and networking configuration",
-            "networking": "network policies, DNS resolution, and connectivity issues",
-            "storage": "persistent volumes, storage classes, and mount issues",
-            "performance": "resource utilization, bottlenecks, and scaling issues",
-        }
-
-        focus_description = diagnostic_areas.get(focus_area, "general cluster health")
-
-        return f"""Please perform a comprehensive Kubernetes cluster diagnostic focused on {focus_description}{context_info}{namespace_info}.
+_LOG_SECTION: Final = """
+6. **Log Analysis**:
+   - Retrieve and analyze recent logs from all containers
+   - Look for error patterns, stack traces, and warning messages
+   - Check for resource exhaustion indicators
+   - Examine startup and shutdown sequences
+"""
+
+_NETWORK_SECTION: Final = """
+- Network policies and traffic flow
+- Ingress controllers and load balancers  
+- Service mesh components (if present)
+- DNS and service discovery patterns
+"""
+
+_DIAGNOSE_TEMPLATE: Final = """Please perform a comprehensive Kubernetes cluster diagnostic focused on {focus_description}{context_info}{namespace_info}.
 
 Use the available kubectl tools to:
 
@@ -64,51 +94,7 @@ Use the available kubectl tools to:
 
 Please start by gathering the cluster information and then provide a structured diagnostic report."""
 
-    @mcp.prompt()
-    def cluster_health_overview(
-        context: str | None = None,
-        include_metrics: bool = True,
-        generate_dashboard: bool = False,
-    ) -> str:
-        """Generate a prompt for comprehensive cluster health overview and monitoring dashboard.
-
-        Args:
-            context: Kubernetes context to analyze (optional, uses current if not specified)
-            include_metrics: Whether to include detailed resource metrics and utilization
-            generate_dashboard: Whether to generate a visual dashboard representation
-        """
-        context_info = f" for context '{context}'" if context else ""
-
-        dashboard_section = (
-            """
-6. **Visual Dashboard** (create a comprehensive monitoring dashboard):
-   - Generate a Mermaid diagram showing cluster architecture
-   - Create charts showing resource utilization trends
-   - Include status indicators for all major components
-   - Add capacity planning recommendations
-"""
-            if generate_dashboard
-            else ""
-        )
-
-        metrics_section = (
-            """
-4. **Resource Metrics & Utilization**:
-   - CPU and memory usage across nodes and pods
-   - Storage utilization and available capacity
-   - Network traffic patterns and bottlenecks
-   - Identify over/under-provisioned resources
-
-5. **Capacity Planning**:
-   - Current vs. requested vs. allocated resources
-   - Scaling recommendations for deployments
-   - Node capacity analysis and expansion needs
-"""
-            if include_metrics
-            else ""
-        )
-
-        return f"""Please provide a comprehensive Kubernetes cluster health overview{context_info}.
+_HEALTH_TEMPLATE: Final = """Please provide a comprehensive Kubernetes cluster health overview{context_info}.
 
 Analyze and report on:
 
@@ -138,37 +124,7 @@ Format the output as a structured health report with:
 
 Start by gathering cluster information using the available kubectl tools."""
 
-    @mcp.prompt()
-    def troubleshoot_workload(
-        workload_type: str,
-        workload_name: str,
-        namespace: str = "default",
-        context: str | None = None,
-        include_logs: bool = True,
-    ) -> str:
-        """Generate a targeted troubleshooting prompt for specific Kubernetes workloads.
-
-        Args:
-            workload_type: Type of workload (deployment, pod, service, statefulset, etc.)
-            workload_name: Name of the specific workload to troubleshoot
-            namespace: Namespace where the workload is located (default: "default")
-            context: Kubernetes context to use (optional, uses current context if not specified)
-            include_logs: Whether to include log analysis in troubleshooting
-        """
-        context_info = f" in context '{context}'" if context else ""
-        log_section = (
-            """
-6. **Log Analysis**:
-   - Retrieve and analyze recent logs from all containers
-   - Look for error patterns, stack traces, and warning messages
-   - Check for resource exhaustion indicators
-   - Examine startup and shutdown sequences
-"""
-            if include_logs
-            else ""
-        )
-
-        return f"""Please troubleshoot the {workload_type} '{workload_name}' in namespace '{namespace}'{context_info}.
+_TROUBLESHOOT_TEMPLATE: Final = """Please troubleshoot the {workload_type} '{workload_name}' in namespace '{namespace}'{context_info}.
 
 Perform systematic troubleshooting:
 
@@ -209,47 +165,7 @@ Perform systematic troubleshooting:
 
 Please create a detailed troubleshooting report with root cause analysis and actionable solutions."""
 
-    @mcp.prompt()
-    def generate_architecture_diagram(
-        scope: str = "cluster",
-        context: str | None = None,
-        namespace: str | None = None,
-        include_networking: bool = True,
-        diagram_format: str = "mermaid",
-    ) -> str:
-        """Generate a prompt to create comprehensive Kubernetes architecture diagrams.
-
-        Args:
-            scope: Scope of diagram (cluster, namespace, application, networking) (default: "cluster")
-            context: Kubernetes context to diagram (optional, uses current context if not specified)
-            namespace: Specific namespace to focus on (optional, for namespace/application scope)
-            include_networking: Whether to include detailed networking components
-            diagram_format: Format for diagram (mermaid, plantuml, ascii) (default: "mermaid")
-        """
-        context_info = f" in context '{context}'" if context else ""
-        namespace_info = f" focusing on namespace '{namespace}'" if namespace else ""
-
-        scope_instructions = {
-            "cluster": "Create a high-level cluster architecture showing nodes, namespaces, and major components",
-            "namespace": f"Detail the architecture within namespace '{namespace}' showing all workloads and their relationships",
-            "application": f"Focus on application-level architecture within '{namespace}' showing microservices and data flow",
-            "networking": "Emphasize network topology, ingress, services, and communication patterns",
-        }
-
-        instruction = scope_instructions.get(scope, scope_instructions["cluster"])
-
-        network_section = (
-            """
-- Network policies and traffic flow
-- Ingress controllers and load balancers  
-- Service mesh components (if present)
-- DNS and service discovery patterns
-"""
-            if include_networking
-            else ""
-        )
-
-        return f"""Please create a comprehensive Kubernetes architecture diagram{context_info}{namespace_info}.
+_ARCHITECTURE_TEMPLATE: Final = """Please create a comprehensive Kubernetes architecture diagram{context_info}{namespace_info}.
 
 {instruction}
 
@@ -285,3 +201,152 @@ Create the diagram with:
 5. Legend explaining symbols and color meanings
 
 Use the kubectl tools to gather all necessary information, then generate a well-structured {diagram_format} diagram that accurately represents the current architecture."""
+
+
+@lru_cache(maxsize=64)
+def _render_diagnose_cluster_issues(
+    context: str | None, namespace: str | None, focus_area: str
+) -> str:
+    return _DIAGNOSE_TEMPLATE.format(
+        focus_description=_DIAGNOSTIC_AREAS.get(focus_area, "general cluster health"),
+        context_info=f" in context '{context}'" if context else "",
+        namespace_info=f" in namespace '{namespace}'" if namespace else " across all namespaces",
+        focus_area=focus_area,
+    )
+
+
+@lru_cache(maxsize=64)
+def _render_cluster_health_overview(
+    context: str | None, include_metrics: bool, generate_dashboard: bool
+) -> str:
+    return _HEALTH_TEMPLATE.format(
+        context_info=f" for context '{context}'" if context else "",
+        metrics_section=_METRICS_SECTION if include_metrics else "",
+        dashboard_section=_DASHBOARD_SECTION if generate_dashboard else "",
+    )
+
+
+@lru_cache(maxsize=64)
+def _render_troubleshoot_workload(
+    workload_type: str,
+    workload_name: str,
+    namespace: str,
+    context: str | None,
+    include_logs: bool,
+) -> str:
+    return _TROUBLESHOOT_TEMPLATE.format(
+        workload_type=workload_type,
+        workload_name=workload_name,
+        namespace=namespace,
+        context_info=f" in context '{context}'" if context else "",
+        log_section=_LOG_SECTION if include_logs else "",
+    )
+
+
+@lru_cache(maxsize=64)
+def _render_architecture_diagram(
+    scope: str,
+    context: str | None,
+    namespace: str | None,
+    include_networking: bool,
+    diagram_format: str,
+) -> str:
+    instruction = _SCOPE_INSTRUCTIONS.get(scope, _SCOPE_INSTRUCTIONS["cluster"])
+    return _ARCHITECTURE_TEMPLATE.format(
+        context_info=f" in context '{context}'" if context else "",
+        namespace_info=f" focusing on namespace '{namespace}'" if namespace else "",
+        instruction=instruction.format(namespace=namespace),
+        diagram_format=diagram_format,
+        network_section=_NETWORK_SECTION if include_networking else "",
+    )
+
+
+def diagnose_cluster_issues(
+    context: str | None = None, namespace: str | None = None, focus_area: str = "general"
+) -> str:
+    """Generate a comprehensive diagnostic prompt for Kubernetes cluster issues.
+
+    Args:
+        context: Kubernetes context to diagnose (optional, uses current if not specified)
+        namespace: Specific namespace to focus on (optional, checks all if not specified)
+        focus_area: Area to focus diagnostics on - general, pods, services, networking, storage, or performance
+    """
+    return _render_diagnose_cluster_issues(context, namespace, focus_area)
+
+
+def cluster_health_overview(
+    context: str | None = None,
+    include_metrics: bool = True,
+    generate_dashboard: bool = False,
+) -> str:
+    """Generate a prompt for comprehensive cluster health overview and monitoring dashboard.
+
+    Args:
+        context: Kubernetes context to analyze (optional, uses current if not specified)
+        include_metrics: Whether to include detailed resource metrics and utilization
+        generate_dashboard: Whether to generate a visual dashboard representation
+    """
+    return _render_cluster_health_overview(context, include_metrics, generate_dashboard)
+
+
+def troubleshoot_workload(
+    workload_type: str,
+    workload_name: str,
+    namespace: str = "default",
+    context: str | None = None,
+    include_logs: bool = True,
+) -> str:
+    """Generate a targeted troubleshooting prompt for specific Kubernetes workloads.
+
+    Args:
+        workload_type: Type of workload (deployment, pod, service, statefulset, etc.)
+        workload_name: Name of the specific workload to troubleshoot
+        namespace: Namespace where the workload is located (default: "default")
+        context: Kubernetes context to use (optional, uses current context if not specified)
+        include_logs: Whether to include log analysis in troubleshooting
+    """
+    return _render_troubleshoot_workload(
+        workload_type, workload_name, namespace, context, include_logs
+    )
+
+
+def generate_architecture_diagram(
+    scope: str = "cluster",
+    context: str | None = None,
+    namespace: str | None = None,
+    include_networking: bool = True,
+    diagram_format: str = "mermaid",
+) -> str:
+    """Generate a prompt to create comprehensive Kubernetes architecture diagrams.
+
+    Args:
+        scope: Scope of diagram (cluster, namespace, application, networking) (default: "cluster")
+        context: Kubernetes context to diagram (optional, uses current context if not specified)
+        namespace: Specific namespace to focus on (optional, for namespace/application scope)
+        include_networking: Whether to include detailed networking components
+        diagram_format: Format for diagram (mermaid, plantuml, ascii) (default: "mermaid")
+    """
+    return _render_architecture_diagram(
+        scope, context, namespace, include_networking, diagram_format
+    )
+
+
+# Prompts served by every server instance
+_PROMPT_FUNCTIONS = (
+    diagnose_cluster_issues,
+    cluster_health_overview,
+    troubleshoot_workload,
+    generate_architecture_diagram,
+)
+
+
+@lru_cache(maxsize=1)
+def _build_prompts() -> tuple[Prompt, ...]:
+    # Prompts hold no per-server state, so their argument models are built only once
+    return tuple(Prompt.from_function(fn) for fn in _PROMPT_FUNCTIONS)
+
+
+def register_prompts(mcp: FastMCP) -> None:
+    """Register all prompts with the FastMCP server."""
+    for prompt in _build_prompts():
+        mcp.add_prompt(prompt)
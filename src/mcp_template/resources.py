@@ -5,59 +5,82 @@ This is where you define your resources. Users mainly need to modify this file.
 """
 
 from mcp.server.fastmcp import FastMCP
+from pydantic import BaseModel
 
+from .helpers.cache import async_ttl_cache
 from .helpers.k8s import get_cluster_info, get_kubectl_contexts, get_namespaces
 from .helpers.telemetry import tracer
-from .models import ClusterInfo, ErrorResponse, KubectlContextsResponse, NamespacesResponse
+from .models import ErrorResponse
+
+CONTEXTS_URI = "kubectl://contexts"
+CLUSTER_INFO_URI = "kubectl://cluster-info/{context}"
+NAMESPACES_URI = "kubectl://namespaces/{context}"
+
+# How long resource results are reused before kubectl is run again
+_RESOURCE_CACHE_TTL = 5.0
+
+
+def _to_json(response: BaseModel) -> str:
+    """Serialize a response the same way FastMCP serializes non-string resource results.
+
+    Resources return this JSON text; failures are returned as ErrorResponse JSON.
+    """
+    return response.model_dump_json(indent=2)
 
 
 def register_resources(mcp: FastMCP) -> None:
     """Register all resources with the FastMCP server."""
 
-    @mcp.resource("kubectl://contexts")
+    # Cached lookups shared by all requests, keyed by context only. Logs from a
+    # lookup go to the request that started it. Results are cached as the JSON text
+    # FastMCP would otherwise produce from the model on every read.
+    @async_ttl_cache(ttl=_RESOURCE_CACHE_TTL)
+    async def _contexts() -> str:
+        contexts = await get_kubectl_contexts(ctx=mcp.get_context())
+        return _to_json(contexts)
+
+    @async_ttl_cache(ttl=_RESOURCE_CACHE_TTL)
+    async def _cluster_info(context: str | None) -> str:
+        cluster_info = await get_cluster_info(context, ctx=mcp.get_context())
+        return _to_json(cluster_info)
+
+    @async_ttl_cache(ttl=_RESOURCE_CACHE_TTL)
+    async def _namespaces(context: str | None) -> str:
+        namespaces = await get_namespaces(context, ctx=mcp.get_context())
+        return _to_json(namespaces)
+
+    @mcp.resource(CONTEXTS_URI)
     @tracer(
         name="resource.kubectl_contexts",
         attribute_prefix="mcp.resource",
     )
-    async def kubectl_contexts() -> KubectlContextsResponse | ErrorResponse:
-        """List all available kubectl contexts."""
+    async def kubectl_contexts() -> str:
+        """List all available kubectl contexts as KubectlContextsResponse JSON."""
         try:
-            contexts = await get_kubectl_contexts(ctx=mcp.get_context())
-            return contexts
+            return await _contexts()
         except Exception as e:
-            return ErrorResponse(error=f"Error getting kubectl contexts: {str(e)}")
+            return _to_json(ErrorResponse.for_context("kubectl contexts", None, e))
 
-    @mcp.resource("kubectl://cluster-info/{context}")
+    @mcp.resource(CLUSTER_INFO_URI)
     @tracer(
         name="resource.kubectl_cluster_info",
         attribute_prefix="mcp.resource",
     )
-    async def kubectl_cluster_info(context: str = "default") -> ClusterInfo | ErrorResponse:
-        """Get cluster information for specified context."""
+    async def kubectl_cluster_info(context: str = "default") -> str:
+        """Get cluster information for specified context as ClusterInfo JSON."""
         try:
-            cluster_info = await get_cluster_info(
-                context if context != "default" else None, ctx=mcp.get_context()
-            )
-            return cluster_info
+            return await _cluster_info(context if context != "default" else None)
         except Exception as e:
-            return ErrorResponse(
-                error=f"Error getting cluster info for context '{context}': {str(e)}",
-                context=context,
-            )
+            return _to_json(ErrorResponse.for_context("cluster info", context, e))
 
-    @mcp.resource("kubectl://namespaces/{context}")
+    @mcp.resource(NAMESPACES_URI)
     @tracer(
         name="resource.kubectl_namespaces",
         attribute_prefix="mcp.resource",
     )
-    async def kubectl_namespaces_context(context: str) -> NamespacesResponse | ErrorResponse:
-        """List all namespaces in the specified context."""
+    async def kubectl_namespaces_context(context: str) -> str:
+        """List all namespaces in the specified context as NamespacesResponse JSON."""
         try:
-            namespaces = await get_namespaces(
-                context if context != "default" else None, ctx=mcp.get_context()
-            )
-            return namespaces
+            return await _namespaces(context if context != "default" else None)
         except Exception as e:
-            return ErrorResponse(
-                error=f"Error getting namespaces for context '{context}': {str(e)}", context=context
-            )
+            return _to_json(ErrorResponse.for_context("namespaces", context, e))
@@ -1,52 +1,91 @@
 """Core MCP server implementation using FastMCP."""
 
+import asyncio
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from mcp.server.fastmcp import FastMCP
 
 from . import prompts, resources, tools
+from .helpers import k8s
+
+_prewarm_task: asyncio.Task[None] | None = None
 
-# Initialize OpenTelemetry instrumentation
-try:
-    import os
 
-    from opentelemetry import trace
-    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-    from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
-    from opentelemetry.sdk.resources import Resource
-    from opentelemetry.sdk.trace import TracerProvider
-    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+def _init_otel() -> None:
+    """Export traces to an OTLP collector.
+
+    Only called when OTEL_TRACES_EXPORTER=otlp, so the OpenTelemetry SDK and the gRPC
+    exporter aren't imported otherwise. Without a configured tracer provider the
+    tracing decorators leave handlers unwrapped.
+    """
+    try:
+        from opentelemetry import trace
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    except ImportError:
+        # OpenTelemetry not available, continue without instrumentation
+        return
 
     # Only set up if not already configured
-    if not isinstance(trace.get_tracer_provider(), TracerProvider):
-        # Create resource with service information
-        resource = Resource.create(
-            {
-                "service.name": os.getenv("OTEL_SERVICE_NAME", "mcp-server"),
-                "service.version": "0.1.0",
-            }
-        )
-
-        # Set up tracer provider
-        tracer_provider = TracerProvider(resource=resource)
-        trace.set_tracer_provider(tracer_provider)
-
-        # Add OTLP exporter if enabled
-        if os.getenv("OTEL_TRACES_EXPORTER", "none") == "otlp":
-            otlp_exporter = OTLPSpanExporter(
-                endpoint=os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4317"),
-                insecure=True,
-            )
-            span_processor = BatchSpanProcessor(otlp_exporter)
-            tracer_provider.add_span_processor(span_processor)
-
-except ImportError:
-    # OpenTelemetry not available, continue without instrumentation
-    pass
+    if isinstance(trace.get_tracer_provider(), TracerProvider):
+        return
+
+    # Create resource with service information
+    resource = Resource.create(
+        {
+            "service.name": os.getenv("OTEL_SERVICE_NAME", "mcp-server"),
+            "service.version": "0.1.0",
+        }
+    )
+
+    # Set up tracer provider with the OTLP exporter
+    tracer_provider = TracerProvider(resource=resource)
+    otlp_exporter = OTLPSpanExporter(
+        endpoint=os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4317"),
+        insecure=True,
+    )
+    tracer_provider.add_span_processor(BatchSpanProcessor(otlp_exporter))
+    trace.set_tracer_provider(tracer_provider)
+
+
+# Initialize OpenTelemetry instrumentation
+if os.getenv("OTEL_TRACES_EXPORTER", "none") == "otlp":
+    _init_otel()
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Start warming the kubeconfig and default context caches when the first session starts.
+
+    FastMCP enters the lifespan for every session, so the warm-up runs once per
+    process, in the background, and never delays serving. It only reads the
+    kubeconfig and runs `kubectl config current-context`; nothing long-lived is
+    started before a client needs it.
+    """
+    global _prewarm_task
+    if _prewarm_task is None:
+        _prewarm_task = asyncio.create_task(k8s.prewarm())
+    yield
 
 
 def create_server() -> FastMCP:
     """Create and configure the MCP server."""
     # Create FastMCP server with lifespan management
-    mcp = FastMCP(name="mcp-server", instructions="You are a Kubernetes operations assistant. Use kubectl tool to inspect pods, deployments, services, and logs. Use base64 tool to decode secrets or encode config data. Always check current cluster context first, request user confirmation for any destructive operations, and provide actionable troubleshooting steps.")
+    mcp = FastMCP(
+        name="mcp-server",
+        lifespan=_lifespan,
+        instructions=(
+            "You are a Kubernetes operations assistant. Use kubectl tool to inspect pods, "
+            "deployments, services, and logs. Use base64 tool to decode secrets or encode "
+            "config data. Always check current cluster context first, request user "
+            "confirmation for any destructive operations, and provide actionable "
+            "troubleshooting steps."
+        ),
+    )
 
     # Register all handlers with the mcp instance
     prompts.register_prompts(mcp)
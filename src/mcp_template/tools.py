@@ -4,27 +4,162 @@ Tools implementation for MCP server.
 This is where you define your tools. Users mainly need to modify this file.
 """
 
-import base64 as b64
-from typing import Any, Literal
+import asyncio
+import binascii
+import os
+import shlex
+import time
+import warnings
+from collections import deque
+from collections.abc import Callable
+from typing import Any, Literal, cast
 
 from mcp.server.elicitation import AcceptedElicitation, CancelledElicitation, DeclinedElicitation
 from mcp.server.fastmcp import Context, FastMCP
 from mcp.server.session import ServerSession
 from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
 
 from .helpers import logger
 from .helpers.cmd_runner import CommandError, run_kubectl_command
 from .helpers.k8s import get_default_context
 from .helpers.telemetry import tracer
 
+try:
+    # SIMD-accelerated drop-in for the stdlib module, much faster on large payloads
+    import pybase64 as b64
+except ImportError:
+    import base64 as b64
+
 approval_required = False
 
+# kubectl subcommands that may modify cluster state and need confirmation
+_DANGEROUS_COMMANDS = frozenset(
+    {
+        "delete",
+        "apply",
+        "create",
+        "replace",
+        "patch",
+        "edit",
+        "scale",
+        "rollout",
+        "drain",
+        "cordon",
+        "uncordon",
+        "taint",
+    }
+)
+# Subcommands of dangerous commands that only read cluster state
+_READ_ONLY_SUBCOMMANDS = {"rollout": frozenset({"history", "status"})}
+# --dry-run values that don't persist anything (none, false, ... do)
+_DRY_RUN_MODES = frozenset({"client", "server"})
+
+
+def _positive_int_env(name: str, default: int) -> int:
+    """Read an integer >= 1 from the environment, or warn and return default."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        parsed = 0
+    if parsed < 1:
+        warnings.warn(
+            f"Ignoring {name}={value!r}: expected an integer >= 1, using {default}",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        return default
+    return parsed
+
+
+# Cap on kubectl processes run by the tool at once; further calls queue for a slot
+# and fail if none frees up within the queue timeout
+_KUBECTL_MAX_CONCURRENCY = _positive_int_env("MCP_KUBECTL_MAX_CONCURRENCY", 8)
+_KUBECTL_QUEUE_TIMEOUT = float(os.getenv("MCP_KUBECTL_QUEUE_TIMEOUT", "30"))
+_kubectl_slots = asyncio.Semaphore(_KUBECTL_MAX_CONCURRENCY)
+
+# Seconds to wait for the user to confirm a dangerous command before cancelling it
+_ELICIT_TIMEOUT = float(os.getenv("MCP_ELICIT_TIMEOUT", "60"))
+
+# Most kubectl tool calls accepted per minute (0 disables the limit)
+_KUBECTL_MAX_PER_MINUTE = int(os.getenv("MCP_KUBECTL_MAX_QPM", "60"))
+
+_b64encode: Callable[[bytes], bytes] = b64.b64encode
+_b64decode: Callable[[str | bytes], bytes] = b64.b64decode
+
 class ConfirmationSchema(BaseModel):
     """Schema for user confirmation."""
 
     accept: bool
 
 
+class ToolCall(BaseModel):
+    """A single tool call made by the batch tool."""
+
+    tool: str
+    arguments: dict[str, Any] = {}
+
+
+class _RateLimiter:
+    """Sliding-window limit on how many calls are accepted per time window."""
+
+    def __init__(self, max_calls: int, window: float):
+        self.max_calls = max_calls
+        self.window = window
+        self._calls: deque[float] = deque()
+
+    def allow(self) -> bool:
+        """Record a call and return True, or return False if the limit is reached."""
+        if self.max_calls <= 0:
+            return True
+        now = time.monotonic()
+        while self._calls and now - self._calls[0] >= self.window:
+            self._calls.popleft()
+        if len(self._calls) >= self.max_calls:
+            return False
+        self._calls.append(now)
+        return True
+
+
+_kubectl_rate_limiter = _RateLimiter(_KUBECTL_MAX_PER_MINUTE, 60.0)
+
+
+def _is_dry_run_or_read_only(args: list[str]) -> bool:
+    """Whether a (dangerous) kubectl command can't change cluster state."""
+    if len(args) > 1 and args[1] in _READ_ONLY_SUBCOMMANDS.get(args[0].lower(), ()):
+        return True
+    # kubectl uses the last --dry-run it is given; a bare --dry-run means client
+    dry_run: str | None = None
+    for arg in args:
+        if arg == "--":
+            # Everything after -- belongs to the container command, not to kubectl
+            break
+        if arg == "--dry-run":
+            dry_run = "client"
+        elif arg.startswith("--dry-run="):
+            dry_run = arg.removeprefix("--dry-run=")
+    return dry_run in _DRY_RUN_MODES
+
+
+async def _acquire_kubectl_slot(args: list[str]) -> None:
+    """Wait for a free kubectl slot, raising CommandError if the queue timeout expires."""
+    try:
+        await asyncio.wait_for(_kubectl_slots.acquire(), timeout=_KUBECTL_QUEUE_TIMEOUT)
+    except asyncio.TimeoutError as e:
+        raise CommandError(
+            message=(
+                f"Timed out after {_KUBECTL_QUEUE_TIMEOUT}s waiting to run kubectl "
+                f"({_KUBECTL_MAX_CONCURRENCY} commands already running)"
+            ),
+            cmd=["kubectl", *args],
+            returncode=-1,
+            stderr="Too many concurrent kubectl commands",
+        ) from e
+
+
 def register_tools(mcp: FastMCP) -> None:
     """Register all tools with the FastMCP server."""
 
@@ -45,7 +180,8 @@ def register_tools(mcp: FastMCP) -> None:
         """Execute kubectl commands with comprehensive error handling.
 
         Dangerous commands (delete, apply, create, etc.) will prompt for user confirmation
-        before execution to prevent accidental cluster modifications.
+        before execution to prevent accidental cluster modifications. Dry runs and
+        read-only subcommands (rollout status/history) run without confirmation.
 
         Args:
             cmd: kubectl command as a string (without 'kubectl' prefix)
@@ -65,84 +201,108 @@ def register_tools(mcp: FastMCP) -> None:
             kubectl("apply -f deployment.yaml") - Will ask for confirmation
             kubectl("delete pod my-pod") - Will ask for confirmation
         """
-        args = cmd.split(" ")
+        if not _kubectl_rate_limiter.allow():
+            await logger.warning("kubectl rate limit exceeded", component="kubectl", ctx=ctx)
+            raise ValueError(
+                f"Rate limit exceeded ({_kubectl_rate_limiter.max_calls} kubectl commands "
+                "per minute); retry later"
+            )
+
+        # Split like a shell would, so quoted values (e.g. -l "app in (a, b)") stay whole
+        try:
+            args = shlex.split(cmd)
+        except ValueError as e:
+            raise ValueError("Invalid command: unbalanced quotes or trailing backslash") from e
+        cmd_display = shlex.join(args)
 
         # Get the actual current context if not specified
         if context is None:
             context = await get_default_context(ctx=ctx)
 
         # Check if this is a potentially dangerous command that requires confirmation
-        dangerous_commands = {
-            "delete",
-            "apply",
-            "create",
-            "replace",
-            "patch",
-            "edit",
-            "scale",
-            "rollout",
-            "drain",
-            "cordon",
-            "uncordon",
-            "taint",
-        }
         if approval_required:
-            if args and args[0].lower() in dangerous_commands:
+            if (
+                args
+                and args[0].lower() in _DANGEROUS_COMMANDS
+                and not _is_dry_run_or_read_only(args)
+            ):
                 await logger.warning(
-                    f"Dangerous kubectl command detected: {' '.join(args)}",
+                    "Dangerous kubectl command detected: %s",
+                    cmd_display,
                     component="kubectl",
                     ctx=ctx,
                 )
 
                 # Request user confirmation for dangerous operations
-                confirmation = await ctx.elicit(
-                    f"⚠️  This command may modify cluster state: `kubectl {cmd}`\n\nDo you want to proceed?",
-                    ConfirmationSchema,
-                )
+                try:
+                    confirmation = await asyncio.wait_for(
+                        ctx.elicit(
+                            f"⚠️  This command may modify cluster state: `kubectl {cmd}`\n\n"
+                            "Do you want to proceed?",
+                            ConfirmationSchema,
+                        ),
+                        timeout=_ELICIT_TIMEOUT,
+                    )
+                except asyncio.TimeoutError:
+                    await logger.info(
+                        "Confirmation timed out for dangerous command: %s",
+                        cmd_display,
+                        component="kubectl",
+                        ctx=ctx,
+                    )
+                    return "Command cancelled (confirmation timed out)"
 
                 match confirmation:
                     case AcceptedElicitation(data=response):
                         if response.accept:
                             await logger.info(
-                                f"User confirmed dangerous command: {' '.join(args)}",
+                                "User confirmed dangerous command: %s",
+                                cmd_display,
                                 component="kubectl",
                                 ctx=ctx,
                             )
                         else:
                             await logger.info(
-                                f"User rejected dangerous command: {' '.join(args)}",
+                                "User rejected dangerous command: %s",
+                                cmd_display,
                                 component="kubectl",
                                 ctx=ctx,
                             )
                             return "Command rejected by user"
                     case DeclinedElicitation():
                         await logger.info(
-                            f"User declined dangerous command: {' '.join(args)}",
+                            "User declined dangerous command: %s",
+                            cmd_display,
                             component="kubectl",
                             ctx=ctx,
                         )
                         return "Command declined by user"
                     case CancelledElicitation():
                         await logger.info(
-                            f"User cancelled dangerous command: {' '.join(args)}",
+                            "User cancelled dangerous command: %s",
+                            cmd_display,
                             component="kubectl",
                             ctx=ctx,
                         )
                         return "Command cancelled by user"
 
         await logger.info(
-            f"Executing kubectl command: {' '.join(args)}", component="kubectl", ctx=ctx
+            "Executing kubectl command: %s", cmd_display, component="kubectl", ctx=ctx
         )
 
         try:
-            result = await run_kubectl_command(
-                args=args,
-                context=context,
-                namespace=namespace,
-                output_format=output_format,
-                timeout=timeout,
-                ctx=ctx,
-            )
+            await _acquire_kubectl_slot(args)
+            try:
+                result = await run_kubectl_command(
+                    args=args,
+                    context=context,
+                    namespace=namespace,
+                    output_format=output_format,
+                    timeout=timeout,
+                    ctx=ctx,
+                )
+            finally:
+                _kubectl_slots.release()
 
             await logger.debug(
                 "kubectl command completed successfully", component="kubectl", ctx=ctx
@@ -152,7 +312,8 @@ def register_tools(mcp: FastMCP) -> None:
 
         except CommandError as e:
             await logger.error(
-                f"kubectl command failed: {e.message}",
+                "kubectl command failed: %s",
+                e.message,
                 component="kubectl",
                 ctx=ctx,
             )
@@ -181,21 +342,17 @@ def register_tools(mcp: FastMCP) -> None:
             base64("SGVsbG8gV29ybGQ=", "decode") -> "Hello World"
             base64("Hello 世界", "encode", "utf-8") -> "SGVsbG8g5LiW55WM"
         """
-        if action not in ["encode", "decode"]:
-            error_msg = f"Invalid action '{action}'. Must be 'encode' or 'decode'"
-            await logger.error(error_msg, component="base64", ctx=ctx)
-            raise ValueError(error_msg)
-
         try:
             if action == "encode":
                 await logger.info(
-                    f"Encoding text to base64 (length: {len(text)})",
+                    "Encoding text to base64 (length: %d)",
+                    len(text),
                     component="base64",
                     ctx=ctx,
                 )
                 
-                encoded_bytes = text.encode(encoding)
-                result = b64.b64encode(encoded_bytes).decode('ascii')
+                # Chained so the raw bytes are freed before the ASCII copy is made
+                result = _b64encode(text.encode(encoding)).decode("ascii")
                 
                 await logger.debug(
                     "Base64 encoding completed successfully",
@@ -205,16 +362,15 @@ def register_tools(mcp: FastMCP) -> None:
                 
             else:  # decode
                 await logger.info(
-                    f"Decoding base64 text (length: {len(text)})",
+                    "Decoding base64 text (length: %d)",
+                    len(text),
                     component="base64",
                     ctx=ctx,
                 )
                 
-                # Remove any whitespace that might interfere with decoding
-                cleaned_text = text.strip()
-                
-                decoded_bytes = b64.b64decode(cleaned_text)
-                result = decoded_bytes.decode(encoding)
+                # Non-validating decode skips whitespace (and any other non-alphabet
+                # characters) itself, so the text isn't copied just to strip it
+                result = _b64decode(text).decode(encoding)
                 
                 await logger.debug(
                     "Base64 decoding completed successfully",
@@ -225,20 +381,62 @@ def register_tools(mcp: FastMCP) -> None:
             return result
             
         except UnicodeEncodeError as e:
-            error_msg = f"Failed to encode text with {encoding} encoding: {str(e)}"
+            error_msg = f"Failed to encode text with {encoding} encoding: {e}"
             await logger.error(error_msg, component="base64", ctx=ctx)
-            raise ValueError(error_msg)
-        except Exception as e:
-            # Handle both base64 decoding errors and unicode decoding errors
-            if action == "decode":
-                if "Invalid base64-encoded string" in str(e) or "binascii.Error" in str(type(e)):
-                    error_msg = f"Invalid base64 string: {str(e)}"
-                elif "UnicodeDecodeError" in str(type(e)):
-                    error_msg = f"Failed to decode bytes with {encoding} encoding: {str(e)}"
-                else:
-                    error_msg = f"Base64 decoding failed: {str(e)}"
-            else:
-                error_msg = f"Base64 encoding failed: {str(e)}"
-                
+            raise ValueError(error_msg) from e
+        except UnicodeDecodeError as e:
+            error_msg = f"Failed to decode bytes with {encoding} encoding: {e}"
+            await logger.error(error_msg, component="base64", ctx=ctx)
+            raise ValueError(error_msg) from e
+        except binascii.Error as e:
+            error_msg = f"Invalid base64 string: {e}"
+            await logger.error(error_msg, component="base64", ctx=ctx)
+            raise ValueError(error_msg) from e
+        except (LookupError, ValueError) as e:
+            # Unknown encoding, or non-ASCII characters in the text to decode
+            operation = "decoding" if action == "decode" else "encoding"
+            error_msg = f"Base64 {operation} failed: {e}"
             await logger.error(error_msg, component="base64", ctx=ctx)
-            raise ValueError(error_msg)
+            raise ValueError(error_msg) from e
+
+    @mcp.tool()
+    # The nested calls carry other tools' arguments, which this span can't redact
+    @tracer(name="tool.batch", arg_denylist={"ctx", "calls"})
+    async def batch(
+        calls: list[ToolCall],
+        ctx: Context[ServerSession, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Run several independent tool calls concurrently in one request.
+
+        Use this instead of one request per call when the calls don't depend on each
+        other's results, e.g. reading several resources at once. kubectl calls still
+        share the server's limit on concurrent kubectl commands.
+
+        Args:
+            calls: Tool calls to run, each with the tool name and its arguments
+
+        Returns:
+            One entry per call, in order: {"tool": ..., "result": ...} on success or
+            {"tool": ..., "error": ...} if the call failed
+
+        Examples:
+            batch([{"tool": "kubectl", "arguments": {"cmd": "get pods"}},
+                   {"tool": "kubectl", "arguments": {"cmd": "get services"}}])
+        """
+        await logger.info("Running %d tool calls", len(calls), component="batch", ctx=ctx)
+
+        async def run_call(call: ToolCall) -> dict[str, Any]:
+            if call.tool == "batch":
+                return {"tool": call.tool, "error": "batch calls can't be nested"}
+            try:
+                result = await mcp.call_tool(call.tool, call.arguments)
+            except Exception as e:
+                return {"tool": call.tool, "error": str(e)}
+            if isinstance(result, tuple):
+                # Tools with an output schema return (content, structured output), and
+                # FastMCP wraps non-object return values as {"result": value}
+                _, structured = cast(tuple[Any, dict[str, Any]], result)
+                return {"tool": call.tool, "result": structured.get("result", structured)}
+            return {"tool": call.tool, "result": to_jsonable_python(result, exclude_none=True)}
+
+        return list(await asyncio.gather(*(run_call(call) for call in calls)))
@@ -5,18 +5,21 @@ import pytest
 from mcp_template.server import create_server
 
 
-def test_fastmcp_server_creation():
+@pytest.fixture(scope="module")
+def server():
+    """One server shared by these read-only tests, as building it is the slow part."""
+    return create_server()
+
+
+def test_fastmcp_server_creation(server):
     """Test that the FastMCP server can be created."""
-    server = create_server()
     assert server is not None
     assert server.name == "mcp-server"
 
 
 @pytest.mark.asyncio
-async def test_server_tool_registration():
+async def test_server_tool_registration(server):
     """Test that tools are properly registered."""
-    server = create_server()
-
     # Check tools are available via the public API
     tools = await server.list_tools()
     tool_names = {tool.name for tool in tools}
@@ -28,10 +31,8 @@ async def test_server_tool_registration():
 
 
 @pytest.mark.asyncio
-async def test_server_prompt_registration():
+async def test_server_prompt_registration(server):
     """Test that prompts are properly registered."""
-    server = create_server()
-
     # Check prompts are available via the public API
     prompts = await server.list_prompts()
     prompt_names = {prompt.name for prompt in prompts}
@@ -45,10 +46,8 @@ async def test_server_prompt_registration():
 
 
 @pytest.mark.asyncio
-async def test_server_resource_registration():
+async def test_server_resource_registration(server):
     """Test that resources are properly registered."""
-    server = create_server()
-
     # Check resources are available via the public API
     resources = await server.list_resources()
     resource_uris = {str(resource.uri) for resource in resources}
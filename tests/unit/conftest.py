@@ -0,0 +1,54 @@
+"""Shared fixtures for unit tests."""
+
+import json
+import os
+import sys
+import textwrap
+
+import pytest
+
+FAKE_KUBECTL = textwrap.dedent(
+    """\
+    #!{python}
+    import json, os, sys, time
+
+    with open(os.environ["FAKE_KUBECTL_LOG"], "a") as log:
+        log.write(json.dumps(sys.argv[1:]) + "\\n")
+    time.sleep(float(os.environ.get("FAKE_KUBECTL_SLEEP", "0")))
+    sys.stdout.write(os.environ.get("FAKE_KUBECTL_STDOUT", ""))
+    sys.stderr.write(os.environ.get("FAKE_KUBECTL_STDERR", ""))
+    sys.exit(int(os.environ.get("FAKE_KUBECTL_EXIT", "0")))
+    """
+)
+
+
+class FakeKubectl:
+    """Controls the output of a fake kubectl executable and records its calls."""
+
+    def __init__(self, monkeypatch: pytest.MonkeyPatch, log_path: str):
+        self._monkeypatch = monkeypatch
+        self._log_path = log_path
+
+    def respond(self, stdout: str = "", stderr: str = "", exit_code: int = 0, sleep: float = 0):
+        self._monkeypatch.setenv("FAKE_KUBECTL_STDOUT", stdout)
+        self._monkeypatch.setenv("FAKE_KUBECTL_STDERR", stderr)
+        self._monkeypatch.setenv("FAKE_KUBECTL_EXIT", str(exit_code))
+        self._monkeypatch.setenv("FAKE_KUBECTL_SLEEP", str(sleep))
+
+    @property
+    def calls(self) -> list[list[str]]:
+        if not os.path.exists(self._log_path):
+            return []
+        with open(self._log_path) as f:
+            return [json.loads(line) for line in f]
+
+
+@pytest.fixture
+def fake_kubectl(tmp_path, monkeypatch):
+    """Put a scriptable fake kubectl first on PATH."""
+    script = tmp_path / "kubectl"
+    script.write_text(FAKE_KUBECTL.format(python=sys.executable))
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_KUBECTL_LOG", str(tmp_path / "calls.log"))
+    return FakeKubectl(monkeypatch, str(tmp_path / "calls.log"))
@@ -0,0 +1,85 @@
+"""Unit tests for the async caching helpers."""
+
+import asyncio
+
+import pytest
+
+from mcp_template.helpers.cache import async_ttl_cache
+
+
+def _counting(ttl: float = 5.0, maxsize: int = 128, delay: float = 0.0, fail: bool = False):
+    calls = []
+
+    @async_ttl_cache(ttl=ttl, maxsize=maxsize)
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(delay)
+        if fail:
+            raise RuntimeError("boom")
+        return f"value-{key}"
+
+    return fetch, calls
+
+
+async def test_async_ttl_cache_reuses_results():
+    """Test that repeated calls with the same arguments hit the cache."""
+    fetch, calls = _counting()
+
+    assert await fetch("a") == "value-a"
+    assert await fetch("a") == "value-a"
+    assert await fetch("b") == "value-b"
+    assert calls == ["a", "b"]
+
+
+async def test_async_ttl_cache_coalesces_concurrent_calls():
+    """Test that concurrent callers share one in-flight call."""
+    fetch, calls = _counting(delay=0.05)
+
+    results = await asyncio.gather(*(fetch("a") for _ in range(5)))
+
+    assert results == ["value-a"] * 5
+    assert calls == ["a"]
+
+
+async def test_async_ttl_cache_expires():
+    """Test that results are recomputed once the TTL has passed."""
+    fetch, calls = _counting(ttl=0.05)
+
+    await fetch("a")
+    await asyncio.sleep(0.1)
+    await fetch("a")
+
+    assert calls == ["a", "a"]
+
+
+async def test_async_ttl_cache_does_not_cache_errors():
+    """Test that a failed call is retried by the next caller."""
+    fetch, calls = _counting(fail=True)
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="boom"):
+            await fetch("a")
+    assert calls == ["a", "a"]
+
+
+async def test_async_ttl_cache_evicts_least_recently_used():
+    """Test that the cache never holds more than maxsize results."""
+    fetch, calls = _counting(maxsize=2)
+
+    for key in ["a", "b", "a", "c", "a", "b"]:
+        await fetch(key)
+
+    assert calls == ["a", "b", "c", "b"]
+
+
+async def test_async_ttl_cache_survives_cancelled_caller():
+    """Test that cancelling one waiter doesn't cancel the shared call."""
+    fetch, calls = _counting(delay=0.05)
+
+    first = asyncio.ensure_future(fetch("a"))
+    second = asyncio.ensure_future(fetch("a"))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "value-a"
+    assert calls == ["a"]
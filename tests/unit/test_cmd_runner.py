@@ -0,0 +1,84 @@
+"""Unit tests for the async command runner."""
+
+import sys
+
+import pytest
+
+from mcp_template.helpers.cmd_runner import CommandError, run_command, run_kubectl_command
+
+
+async def test_run_command_returns_stdout():
+    """Test that stdout is returned as text."""
+    result = await run_command([sys.executable, "-c", "print('hello')"])
+    assert result == "hello\n"
+
+
+async def test_run_command_parses_json():
+    """Test that stdout is parsed when parse_json=True."""
+    result = await run_command(
+        [sys.executable, "-c", "print('{\"items\": [1, 2]}')"], parse_json=True
+    )
+    assert result == {"items": [1, 2]}
+
+
+async def test_run_command_invalid_json():
+    """Test that unparsable output raises CommandError."""
+    with pytest.raises(CommandError, match="Failed to parse command output as JSON"):
+        await run_command([sys.executable, "-c", "print('not json')"], parse_json=True)
+
+
+async def test_run_command_nonzero_exit():
+    """Test that a failing command raises CommandError with its stderr."""
+    with pytest.raises(CommandError) as exc_info:
+        await run_command(
+            [sys.executable, "-c", "import sys; sys.stderr.write('boom'); sys.exit(3)"]
+        )
+    assert exc_info.value.returncode == 3
+    assert exc_info.value.stderr == "boom"
+    assert exc_info.value.message.endswith(
+        "exit code 3: " + " ".join(exc_info.value.cmd) + "\nStderr: boom"
+    )
+    assert str(exc_info.value) == exc_info.value.message
+
+
+async def test_run_command_nonzero_exit_unchecked():
+    """Test that check=False returns output despite a non-zero exit code."""
+    result = await run_command(
+        [sys.executable, "-c", "print('partial'); raise SystemExit(1)"], check=False
+    )
+    assert result == "partial\n"
+
+
+async def test_run_command_timeout():
+    """Test that a command exceeding its timeout is killed and reported."""
+    with pytest.raises(CommandError, match="timed out") as exc_info:
+        await run_command([sys.executable, "-c", "import time; time.sleep(10)"], timeout=0.2)
+    assert exc_info.value.returncode == -1
+
+
+async def test_run_command_missing_executable():
+    """Test that a missing executable is reported as a CommandError."""
+    with pytest.raises(CommandError, match="Unexpected error running command"):
+        await run_command(["definitely-not-a-real-binary-xyz"])
+
+
+@pytest.mark.parametrize(
+    ("args", "expected"),
+    [
+        (["get", "pods"], ["get", "pods", "--output", "json"]),
+        (["kubectl", "get", "pods"], ["get", "pods", "--output", "json"]),
+        (["get", "pod", "kubectl"], ["get", "pod", "kubectl", "--output", "json"]),
+        (["get", "pods", "-o", "wide"], ["get", "pods", "-o", "wide"]),
+        (["get", "pods", "-oyaml"], ["get", "pods", "-oyaml"]),
+        (["get", "pods", "--output=name"], ["get", "pods", "--output=name"]),
+    ],
+)
+async def test_run_kubectl_command_builds_args(fake_kubectl, args, expected):
+    """Test kubectl prefix and --output handling without mutating the caller's list."""
+    fake_kubectl.respond(stdout="{}")
+    original = list(args)
+
+    await run_kubectl_command(args)
+
+    assert fake_kubectl.calls == [expected]
+    assert args == original
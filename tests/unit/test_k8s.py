@@ -0,0 +1,143 @@
+"""Unit tests for the Kubernetes helpers."""
+
+import asyncio
+import os
+
+import pytest
+
+from mcp_template.helpers import k8s
+from mcp_template.helpers.k8s import (
+    get_cluster_info,
+    get_default_context,
+    get_kubectl_contexts,
+    get_namespaces,
+)
+
+KUBECONFIG = """
+current-context: dev
+contexts:
+  - name: dev
+    context: {cluster: dev-cluster, user: dev-user}
+  - name: prod
+    context: {cluster: prod-cluster, user: prod-user, namespace: web}
+"""
+
+
+@pytest.fixture(autouse=True)
+def kubeconfig(tmp_path, monkeypatch):
+    """Point KUBECONFIG at a temporary file and start every test with empty caches."""
+    path = tmp_path / "config"
+    path.write_text(KUBECONFIG)
+    monkeypatch.setenv("KUBECONFIG", str(path))
+    monkeypatch.setattr(k8s, "_default_context_cache", None)
+    monkeypatch.setattr(k8s, "_kubeconfig_cache", None)
+    monkeypatch.setattr(k8s, "_default_context_lock", asyncio.Lock())
+    return path
+
+
+async def test_get_default_context_is_cached(fake_kubectl):
+    """Test that concurrent and repeated lookups only run kubectl once."""
+    fake_kubectl.respond(stdout="dev\n", sleep=0.1)
+
+    results = await asyncio.gather(*(get_default_context() for _ in range(3)))
+    assert results == ["dev", "dev", "dev"]
+    assert await get_default_context() == "dev"
+    assert len(fake_kubectl.calls) == 1
+
+
+async def test_get_default_context_refreshes_on_kubeconfig_change(fake_kubectl, kubeconfig):
+    """Test that editing the kubeconfig invalidates the cached context."""
+    fake_kubectl.respond(stdout="dev\n")
+    assert await get_default_context() == "dev"
+
+    fake_kubectl.respond(stdout="prod\n")
+    kubeconfig.write_text(KUBECONFIG.replace("current-context: dev", "current-context: prod"))
+    stat = kubeconfig.stat()
+    os.utime(kubeconfig, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert await get_default_context() == "prod"
+    assert len(fake_kubectl.calls) == 2
+
+
+async def test_get_kubectl_contexts(kubeconfig):
+    """Test that contexts are read from the kubeconfig file."""
+    response = await get_kubectl_contexts()
+
+    assert response.total_count == 2
+    assert [(c.name, c.cluster, c.current) for c in response.contexts] == [
+        ("dev", "dev-cluster", True),
+        ("prod", "prod-cluster", False),
+    ]
+    assert response.contexts[1].namespace == "web"
+
+
+async def test_get_kubectl_contexts_missing_kubeconfig(monkeypatch, tmp_path):
+    """Test that a missing kubeconfig yields an empty list."""
+    monkeypatch.setenv("KUBECONFIG", str(tmp_path / "missing"))
+
+    response = await get_kubectl_contexts()
+
+    assert response.total_count == 0
+
+
+async def test_get_namespaces_fetches_only_needed_fields(fake_kubectl):
+    """Test that namespaces are built from a jsonpath projection."""
+    fake_kubectl.respond(
+        stdout="default\t2024-01-01T00:00:00Z\tActive\nold\t2024-02-01T00:00:00Z\tTerminating\n"
+    )
+
+    response = await get_namespaces("prod")
+
+    assert response.total_count == 2
+    assert response.context == "prod"
+    assert [ns.name for ns in response.namespaces] == ["default", "old"]
+    assert response.namespaces[0].creation_timestamp == "2024-01-01T00:00:00Z"
+    assert response.namespaces[1].phase == "Terminating"
+
+    (call,) = fake_kubectl.calls
+    assert call[:4] == ["get", "namespaces", "--context", "prod"]
+    assert call[4] == "--output"
+    assert call[5].startswith("jsonpath={range .items[*]}{.metadata.name}")
+
+
+async def test_get_cluster_info(fake_kubectl):
+    """Test that cluster-info and version are both fetched for the context."""
+    fake_kubectl.respond(stdout="output\n")
+
+    info = await get_cluster_info("prod")
+
+    assert info.cluster_info == "output\n"
+    assert info.version_info == "output\n"
+    assert info.context == "prod"
+    assert sorted(call[0] for call in fake_kubectl.calls) == ["cluster-info", "version"]
+
+
+async def test_get_cluster_info_default_context_serializes(fake_kubectl):
+    """Test that the default context (None) round-trips through the unvalidated model."""
+    fake_kubectl.respond(stdout="output\n")
+
+    info = await get_cluster_info()
+
+    assert info.model_dump() == {
+        "cluster_info": "output\n",
+        "version_info": "output\n",
+        "context": None,
+    }
+
+
+async def test_prewarm_fills_caches(fake_kubectl):
+    """Test that prewarming resolves the default context ahead of the first call."""
+    fake_kubectl.respond(stdout="dev\n")
+
+    await k8s.prewarm()
+
+    assert await get_default_context() == "dev"
+    assert [call[0] for call in fake_kubectl.calls] == ["config"]
+
+
+async def test_prewarm_ignores_failures(fake_kubectl, monkeypatch, tmp_path):
+    """Test that prewarming without a kubeconfig or working kubectl doesn't raise."""
+    monkeypatch.setenv("KUBECONFIG", str(tmp_path / "missing"))
+    fake_kubectl.respond(exit_code=1)
+
+    await k8s.prewarm()
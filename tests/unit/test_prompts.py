@@ -0,0 +1,45 @@
+"""Unit tests for prompt rendering."""
+
+from mcp_template.prompts import (
+    _render_architecture_diagram,
+    _render_cluster_health_overview,
+    _render_diagnose_cluster_issues,
+)
+
+
+def test_diagnose_cluster_issues_fills_placeholders():
+    """Test that context, namespace and focus area end up in the prompt."""
+    prompt = _render_diagnose_cluster_issues("prod", "web", "pods")
+
+    assert prompt.startswith(
+        "Please perform a comprehensive Kubernetes cluster diagnostic focused on "
+        "pod status, restarts, resource usage, and container issues in context 'prod' "
+        "in namespace 'web'."
+    )
+    assert "Focus on events related to the pods area" in prompt
+
+
+def test_cluster_health_overview_optional_sections():
+    """Test that the metrics and dashboard sections are only included when asked for."""
+    full = _render_cluster_health_overview(None, True, True)
+    bare = _render_cluster_health_overview(None, False, False)
+
+    assert "**Resource Metrics & Utilization**" in full
+    assert "**Visual Dashboard**" in full
+    assert "**Resource Metrics & Utilization**" not in bare
+    assert "**Visual Dashboard**" not in bare
+
+
+def test_architecture_diagram_scope_uses_namespace():
+    """Test that namespace-scoped instructions name the namespace."""
+    prompt = _render_architecture_diagram("namespace", None, "web", False, "ascii")
+
+    assert "Detail the architecture within namespace 'web'" in prompt
+    assert "create a ascii diagram" in prompt
+
+
+def test_rendered_prompts_are_cached():
+    """Test that the same arguments reuse the rendered prompt."""
+    first = _render_diagnose_cluster_issues(None, None, "general")
+
+    assert _render_diagnose_cluster_issues(None, None, "general") is first
@@ -0,0 +1,49 @@
+"""Unit tests for the kubectl resources."""
+
+import asyncio
+import json
+
+from mcp_template.server import create_server
+
+
+async def _read_json(server, uri: str) -> dict:
+    (content,) = await server.read_resource(uri)
+    return json.loads(content.content)
+
+
+async def test_namespaces_resource_error(fake_kubectl):
+    """Test that a failed lookup is returned as an ErrorResponse."""
+    fake_kubectl.respond(stderr="forbidden", exit_code=1)
+
+    data = await _read_json(create_server(), "kubectl://namespaces/prod")
+
+    assert data["context"] == "prod"
+    assert data["error"].startswith("Error getting namespaces for context 'prod': ")
+    assert "forbidden" in data["error"]
+
+
+async def test_namespaces_resource_is_cached(fake_kubectl):
+    """Test that repeated reads within the TTL reuse the first result."""
+    fake_kubectl.respond(stdout="default\t2024-01-01T00:00:00Z\tActive\n")
+    server = create_server()
+
+    first = await _read_json(server, "kubectl://namespaces/default")
+    second = await _read_json(server, "kubectl://namespaces/default")
+
+    assert first == second
+    assert first["context"] is None
+    assert [ns["metadata"]["name"] for ns in first["namespaces"]] == ["default"]
+    assert len(fake_kubectl.calls) == 1
+
+
+async def test_concurrent_reads_share_one_lookup(fake_kubectl):
+    """Test that simultaneous reads of the same resource run kubectl once."""
+    fake_kubectl.respond(stdout="default\t2024-01-01T00:00:00Z\tActive\n", sleep=0.2)
+    server = create_server()
+
+    results = await asyncio.gather(
+        *(_read_json(server, "kubectl://namespaces/prod") for _ in range(5))
+    )
+
+    assert all(result == results[0] for result in results)
+    assert len(fake_kubectl.calls) == 1
@@ -0,0 +1,104 @@
+"""Unit tests for the tracer decorator."""
+
+import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from mcp_template.helpers.telemetry import SECRET_VALUE_RE, _is_secret_value, _truncate, tracer
+
+
+def _make_tracer():
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return provider.get_tracer("test"), exporter
+
+
+def test_tracer_records_bound_args_and_defaults():
+    """Test that positional, keyword and default arguments are recorded."""
+    test_tracer, exporter = _make_tracer()
+
+    @tracer(name="tool.sample", tracer_provider=test_tracer)
+    def sample(cmd: str, namespace: str | None = None, timeout: float = 30.0) -> str:
+        return cmd
+
+    assert sample("get pods", namespace="kube-system") == "get pods"
+
+    (span,) = exporter.get_finished_spans()
+    assert span.name == "tool.sample"
+    assert span.attributes["mcp.tool.arg.cmd"] == "get pods"
+    assert span.attributes["mcp.tool.arg.namespace"] == "kube-system"
+    assert span.attributes["mcp.tool.arg.timeout"] == "30.0"
+    assert span.attributes["mcp.tool.return_length"] == len("get pods")
+
+
+async def test_tracer_redacts_and_skips_denied_args():
+    """Test redaction by key name and value, and the argument denylist."""
+    test_tracer, exporter = _make_tracer()
+
+    @tracer(
+        name="tool.secretive",
+        tracer_provider=test_tracer,
+        redact_keys={"key"},
+        arg_denylist={"ctx"},
+    )
+    async def secretive(key: str, cmd: str, note: str, ctx: object = None) -> None:
+        return None
+
+    await secretive("abc", "get secret my-secret", "plain", ctx=object())
+
+    (span,) = exporter.get_finished_spans()
+    assert span.attributes["mcp.tool.arg.key"] == "***"
+    assert span.attributes["mcp.tool.arg.cmd"] == "***"
+    assert span.attributes["mcp.tool.arg.note"] == "plain"
+    assert "mcp.tool.arg.ctx" not in span.attributes
+
+
+def test_tracer_binds_var_keyword_args():
+    """Test that functions taking **kwargs are still bound correctly."""
+    test_tracer, exporter = _make_tracer()
+
+    @tracer(name="tool.varargs", tracer_provider=test_tracer)
+    def varargs(*items: str, **options: str) -> int:
+        return len(items)
+
+    assert varargs("a", "b", mode="fast") == 2
+
+    (span,) = exporter.get_finished_spans()
+    assert span.attributes["mcp.tool.arg.items"] == "('a', 'b')"
+    assert span.attributes["mcp.tool.arg.options"] == "{'mode': 'fast'}"
+
+
+def test_tracer_returns_function_unwrapped_when_disabled():
+    """Test that a no-op tracer leaves the decorated function untouched."""
+
+    async def noop_tool(cmd: str) -> str:
+        return cmd
+
+    assert tracer(tracer_provider=trace.NoOpTracer())(noop_tool) is noop_tool
+
+
+def test_truncate_bounds_large_containers():
+    """Test that containers are stringified exactly when short and bounded when large."""
+    small = {"app": "web", "replicas": [1, 2, 3], "labels": ("a", "b")}
+    assert _truncate(small) == str(small)
+
+    large = list(range(100_000))
+    truncated = _truncate(large, max_len=64)
+    assert len(truncated) == 64
+    assert truncated.startswith("[0, 1, 2, 3")
+    assert truncated.endswith("…")
+
+    assert _truncate("x" * 300, max_len=10) == "x" * 9 + "…"
+    assert _truncate(3.5) == "3.5"
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["--token=abc", "Bearer xyz", "--ſecret=abc", "paſsword=x", "apıkey=1", "get pods", "tokens"],
+)
+def test_is_secret_value_agrees_with_regex(value):
+    """Test that the substring prefilter never hides a value the regex would match."""
+    assert _is_secret_value(value) == (SECRET_VALUE_RE.search(value) is not None)
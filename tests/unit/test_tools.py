@@ -0,0 +1,193 @@
+"""Unit tests for the kubectl and base64 tools."""
+
+import asyncio
+
+import pytest
+from mcp.server.fastmcp import Context
+from mcp.server.fastmcp.exceptions import ToolError
+
+from mcp_template import tools
+from mcp_template.server import create_server
+
+
+@pytest.fixture
+def server():
+    """A fresh MCP server instance."""
+    return create_server()
+
+
+async def _call(server, name: str, arguments: dict):
+    _, structured = await server.call_tool(name, arguments)
+    return structured["result"]
+
+
+async def test_kubectl_keeps_quoted_arguments_together(server, fake_kubectl):
+    """Test that the command is split like a shell would split it."""
+    fake_kubectl.respond(stdout="{}")
+
+    await _call(
+        server,
+        "kubectl",
+        {"cmd": "get pods  -l 'app in (a, b)'", "context": "prod"},
+    )
+
+    assert fake_kubectl.calls == [
+        ["get", "pods", "-l", "app in (a, b)", "--context", "prod", "--output", "json"]
+    ]
+
+
+@pytest.mark.parametrize("cmd", ["get pods -l 'app=web", "get pods \\"])
+async def test_kubectl_rejects_unsplittable_command(server, fake_kubectl, cmd):
+    """Test that unbalanced quotes are reported as a tool error instead of crashing."""
+    with pytest.raises(ToolError, match="Invalid command: unbalanced quotes"):
+        await _call(server, "kubectl", {"cmd": cmd, "context": "prod"})
+    assert fake_kubectl.calls == []
+
+
+async def test_kubectl_rate_limit(server, fake_kubectl, monkeypatch):
+    """Test that calls beyond the per-minute limit are rejected without running kubectl."""
+    monkeypatch.setattr(tools, "_kubectl_rate_limiter", tools._RateLimiter(2, 60.0))
+    fake_kubectl.respond(stdout="{}")
+
+    for _ in range(2):
+        await _call(server, "kubectl", {"cmd": "get pods", "context": "prod"})
+    with pytest.raises(ToolError, match="Rate limit exceeded"):
+        await _call(server, "kubectl", {"cmd": "get pods", "context": "prod"})
+    assert len(fake_kubectl.calls) == 2
+
+
+async def test_kubectl_fails_when_no_slot_frees_up(server, fake_kubectl, monkeypatch):
+    """Test that a queued command gives up once the queue timeout expires."""
+    monkeypatch.setattr(tools, "_kubectl_slots", asyncio.Semaphore(0))
+    monkeypatch.setattr(tools, "_KUBECTL_QUEUE_TIMEOUT", 0.05)
+
+    with pytest.raises(Exception, match="waiting to run kubectl"):
+        await _call(server, "kubectl", {"cmd": "get pods", "context": "prod"})
+    assert fake_kubectl.calls == []
+
+
+@pytest.mark.parametrize("value", ["0", "-2", "eight", ""])
+def test_invalid_concurrency_setting_falls_back_to_default(monkeypatch, value):
+    """Test that an unusable MCP_KUBECTL_MAX_CONCURRENCY warns and keeps the default."""
+    monkeypatch.setenv("MCP_KUBECTL_MAX_CONCURRENCY", value)
+
+    with pytest.warns(RuntimeWarning, match="MCP_KUBECTL_MAX_CONCURRENCY"):
+        assert tools._positive_int_env("MCP_KUBECTL_MAX_CONCURRENCY", 8) == 8
+
+
+def test_concurrency_setting(monkeypatch):
+    """Test that a valid MCP_KUBECTL_MAX_CONCURRENCY is used."""
+    monkeypatch.setenv("MCP_KUBECTL_MAX_CONCURRENCY", "3")
+
+    assert tools._positive_int_env("MCP_KUBECTL_MAX_CONCURRENCY", 8) == 3
+
+
+@pytest.mark.parametrize(
+    "cmd",
+    [
+        "delete pod web --dry-run=client",
+        "apply -f app.yaml --dry-run=server",
+        "delete pod web --dry-run=none --dry-run",
+        "rollout status deploy/web",
+    ],
+)
+async def test_kubectl_skips_confirmation_for_safe_commands(server, fake_kubectl, monkeypatch, cmd):
+    """Test that dry runs and read-only subcommands don't ask for confirmation."""
+    monkeypatch.setattr(tools, "approval_required", True)
+    fake_kubectl.respond(stdout="{}")
+
+    await _call(server, "kubectl", {"cmd": cmd, "context": "prod"})
+
+    assert len(fake_kubectl.calls) == 1
+
+
+@pytest.mark.parametrize(
+    "cmd",
+    [
+        "rollout restart deploy/web",
+        "create job x --image=busybox -- echo --dry-run",
+        "delete pod web --dry-run=client --dry-run=none",
+        "delete pod web --dry-run=server --dry-run=false",
+        "delete pod web --dry-run=bogus",
+    ],
+)
+async def test_kubectl_asks_confirmation_for_dangerous_commands(
+    server, fake_kubectl, monkeypatch, cmd
+):
+    """Test that a mutating command isn't run without confirmation."""
+    monkeypatch.setattr(tools, "approval_required", True)
+
+    # Outside a client request there is no one to ask, so the call fails
+    with pytest.raises(ToolError):
+        await _call(server, "kubectl", {"cmd": cmd, "context": "prod"})
+    assert fake_kubectl.calls == []
+
+
+async def test_kubectl_cancels_when_confirmation_times_out(server, fake_kubectl, monkeypatch):
+    """Test that an unanswered confirmation cancels the command."""
+
+    async def never_answer(self, message, schema):
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(tools, "approval_required", True)
+    monkeypatch.setattr(tools, "_ELICIT_TIMEOUT", 0.05)
+    monkeypatch.setattr(Context, "elicit", never_answer)
+
+    result = await _call(server, "kubectl", {"cmd": "delete pod web", "context": "prod"})
+
+    assert result == "Command cancelled (confirmation timed out)"
+    assert fake_kubectl.calls == []
+
+
+async def test_base64_round_trip(server):
+    """Test that encoding then decoding returns the original text."""
+    encoded = await _call(server, "base64", {"text": "Hello 世界", "action": "encode"})
+
+    assert encoded == "SGVsbG8g5LiW55WM"
+    assert await _call(server, "base64", {"text": encoded, "action": "decode"}) == "Hello 世界"
+
+
+async def test_base64_decode_ignores_whitespace(server):
+    """Test that surrounding and line-wrapping whitespace doesn't break decoding."""
+    result = await _call(server, "base64", {"text": "  SGVs\nbG8g5LiW55WM \n", "action": "decode"})
+
+    assert result == "Hello 世界"
+
+
+@pytest.mark.parametrize(
+    ("arguments", "message"),
+    [
+        ({"text": "abc", "action": "decode"}, "Invalid base64 string"),
+        ({"text": "/w==", "action": "decode"}, "Failed to decode bytes with utf-8 encoding"),
+        ({"text": "é", "action": "encode", "encoding": "ascii"}, "Failed to encode text"),
+        ({"text": "hi", "action": "encode", "encoding": "nope"}, "Base64 encoding failed"),
+        ({"text": "hi", "action": "rot13"}, "action"),
+    ],
+)
+async def test_base64_errors(server, arguments, message):
+    """Test that each kind of failure is reported with its own message."""
+    with pytest.raises(Exception, match=message):
+        await _call(server, "base64", arguments)
+
+
+async def test_batch_runs_calls_in_order(server, fake_kubectl):
+    """Test that each call's result or error is returned in the order given."""
+    fake_kubectl.respond(stdout='{"items": []}')
+
+    results = await _call(
+        server,
+        "batch",
+        {
+            "calls": [
+                {"tool": "kubectl", "arguments": {"cmd": "get pods", "context": "prod"}},
+                {"tool": "base64", "arguments": {"text": "hi", "action": "encode"}},
+                {"tool": "base64", "arguments": {"text": "abc", "action": "decode"}},
+                {"tool": "batch", "arguments": {"calls": []}},
+            ]
+        },
+    )
+
+    assert results[0] == {"tool": "kubectl", "result": {"items": []}}
+    assert results[1] == {"tool": "base64", "result": "aGk="}
+    assert "Invalid base64 string" in results[2]["error"]
+    assert results[3] == {"tool": "batch", "error": "batch calls can't be nested"}